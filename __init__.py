@@ -9,7 +9,10 @@ bl_info = {
     "category" : "3D View"
 }
 
-from . import blender_game_of_life
+import sys
+# the simulation worker imports this package without Blender
+if "bpy" in sys.modules:
+    from . import blender_game_of_life
 
 def register():
     blender_game_of_life.register()
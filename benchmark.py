@@ -0,0 +1,291 @@
+"""Benchmark of the engines on a fixed pattern corpus and, inside Blender, of the mesh and shape key writes
+
+    python benchmark.py --output engines.json
+    blender --background --factory-startup --python benchmark.py -- --output all.json
+"""
+import os
+import sys
+import json
+import platform
+import tracemalloc
+from argparse import ArgumentParser
+from importlib import import_module
+from random import Random
+from time import perf_counter
+
+try:
+    import bpy
+except ImportError:
+    bpy = None
+
+addon = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(addon))
+core = import_module(os.path.basename(addon) + ".game_of_life")
+bgol = import_module(os.path.basename(addon) + ".blender_game_of_life") if bpy else None
+
+r_pentomino = """
+.OO
+OO.
+.O.
+"""
+
+gosper_glider_gun = """
+........................O...........
+......................O.O...........
+............OO......OO............OO
+...........O...O....OO............OO
+OO........O.....O...OO..............
+OO........O...O.OO....O.O...........
+..........O.....O.......O...........
+...........O...O....................
+............OO......................
+"""
+
+def parse_pattern(pattern: str) -> list:
+    return [(x, -y, 0) for y, line in enumerate(pattern.strip().splitlines()) for x, cell in enumerate(line) if cell == 'O']
+
+def random_soup(seed: int, size: int, density: float, use_3d: bool) -> list:
+    random = Random(seed)
+    depth = size if use_3d else 1
+    return [(x, y, z) for x in range(size) for y in range(size) for z in range(depth) if random.random() < density]
+
+def get_corpus() -> list:
+    """fixed patterns as (name, locations, (low, high, use_3d, use_diagonal, combine_planes))"""
+    corpus = [
+        ("r-pentomino", parse_pattern(r_pentomino), (2, 3, False, False, False)),
+        ("gosper-glider-gun", parse_pattern(gosper_glider_gun), (2, 3, False, False, False))
+    ]
+    for density in (0.1, 0.3, 0.5):
+        corpus.append(("soup-2d-%i%%" %(density * 100), random_soup(0, 128, density, False), (2, 3, False, False, False)))
+    for use_diagonal in (False, True):
+        for combine_planes in (False, True):
+            name = "soup-3d%s%s" %("-diagonal" if use_diagonal else "", "-combined" if combine_planes else "")
+            rules = (4, 5, True, use_diagonal, combine_planes) if combine_planes else (3, 4, True, use_diagonal, combine_planes)
+            corpus.append((name, random_soup(0, 16, 0.2, True), rules))
+    return corpus
+
+def run_engine(engine: str, locations: list, rules: tuple, generations: int) -> tuple:
+    """returns the elapsed seconds, the number of processed cells and all generations"""
+    world = core.engines[engine](locations, *rules)
+    results = [locations]
+    start = perf_counter()
+    for _ in range(generations):
+        results.append(world.step())
+    elapsed = perf_counter() - start
+    return elapsed, sum(map(len, results[1: ])), results
+
+def benchmark_engines(engines: list, generations: int) -> list:
+    results = []
+    for name, locations, rules in get_corpus():
+        for engine in engines:
+            elapsed, cells, _ = run_engine(engine, locations, rules, generations)
+            # peak memory in a separate run, tracing allocations slows the simulation
+            tracemalloc.start()
+            run_engine(engine, locations, rules, generations)
+            peak_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            results.append({
+                'pattern' : name,
+                'engine' : engine,
+                'rules' : rules,
+                'seed_cells' : len(locations),
+                'generations' : generations,
+                'seconds' : elapsed,
+                'generations_per_second' : generations / elapsed,
+                'cells_per_second' : cells / elapsed,
+                'peak_memory' : peak_memory
+            })
+            print("%-26s %-9s %9.1f gen/s %12.0f cells/s %9.1f MiB" %(name, engine, generations / elapsed, cells / elapsed, peak_memory / 2 ** 20))
+    return results
+
+def benchmark_surfaces(generations: int) -> list:
+    """polygons of the greedy meshed surface against a cube per cell, summed over all generations"""
+    results = []
+    for name, locations, rules in get_corpus():
+        _, _, process_locations = run_engine('SPARSE', locations, rules, generations)
+        start = perf_counter()
+        quads = sum(len(core.surface_quads(locations)[1]) for locations in process_locations)
+        elapsed = perf_counter() - start
+        cube_faces = 6 * sum(map(len, process_locations))
+        results.append({
+            'pattern' : name,
+            'cube_faces' : cube_faces,
+            'surface_quads' : quads,
+            'seconds_per_frame' : elapsed / len(process_locations)
+        })
+        print("%-26s %10i cube faces %10i surface quads %6.1fx %8.2f ms/frame" %(name, cube_faces, quads, cube_faces / max(quads, 1), elapsed / len(process_locations) * 1000))
+    return results
+
+def time_playback(collection: bpy.types.Collection, frames: int) -> float:
+    """average time of evaluating one frame with the objects of collection in the scene, the collection is removed afterwards"""
+    scene = bpy.context.scene
+    scene.collection.children.link(collection)
+    start = perf_counter()
+    for frame in range(1, frames + 1):
+        scene.frame_set(frame)
+    elapsed = perf_counter() - start
+    bpy.data.collections.remove(collection)
+    return elapsed / frames
+
+def benchmark_stages(generations: int) -> list:
+    """times growing the processed mesh, writing one shape key per generation and playing back every output mode"""
+    results = []
+    for name, locations, rules in get_corpus():
+        _, _, process_locations = run_engine('DENSE', locations, rules, generations)
+        biggest_mesh = max(map(len, process_locations))
+        mesh = bpy.data.meshes.new("Benchmark")
+        bgol.add_cubes(mesh, len(locations))
+        used = len(locations)
+        start = perf_counter()
+        for locations in process_locations[1: ]:
+            used = bgol.mesh_from_locations(mesh, locations, used)
+        bgol.trim_cubes(mesh, biggest_mesh)
+        mesh_time = perf_counter() - start
+
+        obj = bpy.data.objects.new("Benchmark", mesh)
+        shape_key_add_time = shape_key_write_time = 0
+        for i, locations in enumerate(process_locations):
+            start = perf_counter()
+            shape_key = obj.shape_key_add(name= "Frame %i" %(i + 1), from_mix= False)
+            shape_key_add_time += perf_counter() - start
+            start = perf_counter()
+            bgol.apply_vertices_to_shapekey(shape_key, locations)
+            shape_key_write_time += perf_counter() - start
+            shape_key.interpolation = 'KEY_LINEAR'
+        shape_keys = mesh.shape_keys
+        shape_keys.use_relative = False
+        for i, shape_key in enumerate(shape_keys.key_blocks):
+            shape_keys.eval_time = shape_key.frame
+            shape_keys.keyframe_insert('eval_time', frame= i + 1)
+        frames = len(process_locations)
+        collection = bpy.data.collections.new("Benchmark")
+        collection.objects.link(obj)
+        playback = {'SHAPE_KEYS' : time_playback(collection, frames)}
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+        if bpy.app.version >= (3, 2, 0):
+            for output_mode in ('INSTANCES', 'SURFACE'):
+                collection = bpy.data.collections.new("Benchmark")
+                obj = bpy.data.objects.new("Benchmark", bpy.data.meshes.new("Benchmark"))
+                collection.objects.link(obj)
+                bgol.generation_objects(obj, process_locations, output_mode, list(range(frames)), collection)
+                playback[output_mode] = time_playback(collection, frames)
+                bgol.remove_result(obj)
+        results.append({
+            'pattern' : name,
+            'frames' : frames,
+            'biggest_mesh' : biggest_mesh,
+            'mesh_seconds_per_frame' : mesh_time / frames,
+            'shape_key_add_seconds_per_frame' : shape_key_add_time / frames,
+            'shape_key_write_seconds_per_frame' : shape_key_write_time / frames,
+            'playback_seconds_per_frame' : playback
+        })
+        print("%-26s %7i cubes  mesh %8.2f ms/frame  shape key add %8.2f ms/frame  write %8.2f ms/frame" %(name, biggest_mesh, mesh_time / frames * 1000, shape_key_add_time / frames * 1000, shape_key_write_time / frames * 1000))
+        print("%-26s playback %s" %("", "  ".join("%s %8.2f ms/frame" %(output_mode.lower(), seconds * 1000) for output_mode, seconds in playback.items())))
+    return results
+
+legacy_cube = [(0.5, 0.5, 0.5), (0.5, 0.5, -0.5), (0.5, -0.5, 0.5), (0.5, -0.5, -0.5), (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, -0.5, -0.5)]
+legacy_edges = [(5, 7), (1, 5), (0, 1), (7, 6), (2, 3), (4, 5), (2, 6), (0, 2), (7, 3), (6, 4), (4, 0), (3, 1)]
+legacy_faces = [(0, 4, 6, 2), (3, 2, 6, 7), (7, 6, 4, 5), (5, 1, 3, 7), (1, 0, 2, 3), (5, 4, 0, 1)]
+
+def legacy_mesh_from_locations(mesh, locations, used):
+    """mesh_from_locations before the bulk writes, used is only taken for the same signature"""
+    old_vertices = [tuple(vert.co) for vert in mesh.vertices]
+    old_edges = mesh.edge_keys.copy()
+    old_faces = [tuple(face.vertices) for face in mesh.polygons]
+    missing_locations = int(len(locations) - len(old_vertices) / len(legacy_cube))
+    if missing_locations > 0:
+        for location in locations[-missing_locations: ]:
+            offset = len(old_vertices)
+            old_vertices += [tuple(y - x for x, y in zip(vert, location)) for vert in legacy_cube]
+            old_edges += [tuple(vert + offset for vert in edge) for edge in legacy_edges]
+            old_faces += [tuple(vert + offset for vert in face) for face in legacy_faces]
+        mesh.clear_geometry()
+        mesh.from_pydata(old_vertices, old_edges, old_faces)
+    return max(used, len(locations))
+
+def legacy_apply_vertices_to_shapekey(shapekey, locations):
+    vertices = []
+    for location in locations:
+        vertices += [tuple(y - x for x, y in zip(vert, location)) for vert in legacy_cube]
+    for vert, location in zip(shapekey.data, vertices):
+        vert.co = location
+
+def random_locations(random: Random, cells: int) -> list:
+    size = int(cells ** (1 / 3)) * 2
+    return [(random.randrange(size), random.randrange(size), random.randrange(size)) for _ in range(cells)]
+
+def time_mesh(function, cells: int, frames: int) -> float:
+    """average time of growing a mesh to cells over frames"""
+    random = Random(0)
+    locations = random_locations(random, cells)
+    mesh = bpy.data.meshes.new("Benchmark")
+    elapsed = 0
+    used = 0
+    for frame in range(1, frames + 1):
+        start = perf_counter()
+        used = function(mesh, locations[ : cells * frame // frames], used)
+        elapsed += perf_counter() - start
+    bpy.data.meshes.remove(mesh)
+    return elapsed / frames
+
+def time_shape_keys(function, cells: int, frames: int) -> float:
+    """average time of writing one shape key with cells cubes"""
+    random = Random(0)
+    mesh = bpy.data.meshes.new("Benchmark")
+    bgol.add_cubes(mesh, cells)
+    obj = bpy.data.objects.new("Benchmark", mesh)
+    obj.shape_key_add(name= "Basis", from_mix= False)
+    elapsed = 0
+    for frame in range(frames):
+        shape_key = obj.shape_key_add(name= "Frame %i" %frame, from_mix= False)
+        locations = random_locations(random, cells)
+        start = perf_counter()
+        function(shape_key, locations)
+        elapsed += perf_counter() - start
+    bpy.data.objects.remove(obj)
+    bpy.data.meshes.remove(mesh)
+    return elapsed / frames
+
+def benchmark_geometry(cells: int, frames: int) -> list:
+    """compares the geometry writes before and after the bulk foreach_set writes"""
+    results = []
+    for stage, timer, before, after in (
+        ('mesh', time_mesh, legacy_mesh_from_locations, bgol.mesh_from_locations),
+        ('shape key', time_shape_keys, legacy_apply_vertices_to_shapekey, bgol.apply_vertices_to_shapekey)
+    ):
+        time_before = timer(before, cells, frames)
+        time_after = timer(after, cells, frames)
+        results.append({'stage' : stage, 'cells' : cells, 'before_seconds_per_frame' : time_before, 'after_seconds_per_frame' : time_after})
+        print("%-10s %7i cells  before %9.2f ms/frame  after %9.2f ms/frame  %6.1fx" %(stage, cells, time_before * 1000, time_after * 1000, time_before / time_after))
+    return results
+
+def main(argv: list) -> None:
+    parser = ArgumentParser(description= "Benchmark the engines on a fixed pattern corpus and the geometry writes inside Blender")
+    parser.add_argument('--generations', type= int, default= 100)
+    parser.add_argument('--engines', nargs= '+', choices= list(core.engines), default= list(core.engines))
+    parser.add_argument('--cells', type= int, default= 20000, help= "cells of the before/after geometry comparison")
+    parser.add_argument('--frames', type= int, default= 20, help= "frames of the before/after geometry comparison")
+    parser.add_argument('--output', help= "JSON file for the results")
+    args = parser.parse_args(argv)
+
+    import numpy
+    results = {
+        'python' : platform.python_version(),
+        'numpy' : numpy.__version__,
+        'blender' : bpy.app.version_string if bpy else None,
+        'engines' : benchmark_engines(args.engines, args.generations),
+        'surfaces' : benchmark_surfaces(args.generations)
+    }
+    if bpy:
+        results['stages'] = benchmark_stages(args.generations)
+        results['geometry'] = benchmark_geometry(args.cells, args.frames)
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent= 2)
+
+if __name__ == "__main__":
+    if bpy:
+        main(sys.argv[sys.argv.index("--") + 1: ] if "--" in sys.argv else [])
+    else:
+        main(sys.argv[1: ])
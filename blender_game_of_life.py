@@ -1,13 +1,21 @@
 import bpy
 from bpy.types import Panel, Operator, AddonPreferences
-from bpy.props import IntVectorProperty, IntProperty, BoolProperty, StringProperty
+from bpy.props import IntVectorProperty, IntProperty, BoolProperty, StringProperty, EnumProperty
 from bpy.app.handlers import persistent
+from bpy_extras.io_utils import ImportHelper, ExportHelper
 import bl_math
 import bmesh
-from numpy import zeros
-from operator import itemgetter
+from numpy import zeros, full, array, arange, concatenate, resize, unique, ndarray, int32, float32
 from typing import Tuple, List
 from contextlib import suppress
+from time import perf_counter
+from multiprocessing import get_context
+from struct import error as struct_error
+from zipfile import BadZipFile
+from queue import Empty
+from tempfile import gettempdir
+import os
+from .game_of_life import engine_items, surface_quads, read_pattern, sweep_variants, sweep_seed, run_variant, rank_variants, sweep_ranking_items, rebake, cell_difference, simulate, simulation_worker, load_generations, generation_hash, Profile, GenerationHistory, FrameStore, BakeCache
 
 def get_collection(name: str) -> bpy.types.Collection:
     collection = bpy.data.collections.get(name, None)
@@ -30,6 +38,12 @@ def link_to_collection(collection: bpy.types.Collection, obj: bpy.types.Object)
 def link_to_game_collection(obj: bpy.types.Object) -> None:
     link_to_collection(get_game_collection(), obj)
 
+cube_data = {
+    'vertices' : array([(0.5, 0.5, 0.5), (0.5, 0.5, -0.5), (0.5, -0.5, 0.5), (0.5, -0.5, -0.5), (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, -0.5, -0.5)], dtype= float32),
+    'edges' : array([(5, 7), (1, 5), (0, 1), (7, 6), (2, 3), (4, 5), (2, 6), (0, 2), (7, 3), (6, 4), (4, 0), (3, 1)], dtype= int32),
+    'faces' : array([(0, 4, 6, 2), (3, 2, 6, 7), (7, 6, 4, 5), (5, 1, 3, 7), (1, 0, 2, 3), (5, 4, 0, 1)], dtype= int32)
+}
+
 def get_cell_mesh(overwrite: bool = False) -> bpy.types.Mesh:
     mesh = bpy.data.meshes.get("Game of Life", None)
     if mesh is None or overwrite:
@@ -37,9 +51,9 @@ def get_cell_mesh(overwrite: bool = False) -> bpy.types.Mesh:
             mesh = bpy.data.meshes.new("Game of Life")
         mesh.clear_geometry()
         mesh.from_pydata( # create Cube
-            vertices = [(0.5, 0.5, 0.5), (0.5, 0.5, -0.5), (0.5, -0.5, 0.5), (0.5, -0.5, -0.5), (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, -0.5, -0.5)],
-            edges = [(5, 7), (1, 5), (0, 1), (7, 6), (2, 3), (4, 5), (2, 6), (0, 2), (7, 3), (6, 4), (4, 0), (3, 1)],
-            faces = [(0, 4, 6, 2), (3, 2, 6, 7), (7, 6, 4, 5), (5, 1, 3, 7), (1, 0, 2, 3), (5, 4, 0, 1)]
+            vertices = cube_data['vertices'].tolist(),
+            edges = cube_data['edges'].tolist(),
+            faces = cube_data['faces'].tolist()
         )
     return mesh
 
@@ -50,6 +64,21 @@ def create_cell(position : Tuple[int, int, int]) -> bpy.types.Object:
     link_to_game_collection(obj)
     return obj
 
+seed_property = "game_of_life_seed"
+
+def create_point_set(name: str, cells: ndarray, location: Tuple[int, int, int] = (0, 0, 0)) -> bpy.types.Object:
+    """one object with a point per cell, used as seed instead of a cell object per location"""
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(cells))
+    mesh.vertices.foreach_set('co', array(cells, dtype= float32).ravel())
+    mesh.update()
+    obj = bpy.data.objects.new(name, mesh)
+    obj[seed_property] = True
+    obj.location = location
+    obj.lock_rotation = obj.lock_scale = (True, True, True)
+    link_to_game_collection(obj)
+    return obj
+
 def correct_object(obj: bpy.types.Object, mesh: bpy.types.Mesh) -> None:
     obj.name = f"Cell-{tuple(int(x) for x in obj.location)}"
     obj.parent = None
@@ -57,126 +86,231 @@ def correct_object(obj: bpy.types.Object, mesh: bpy.types.Mesh) -> None:
     obj.scale = (1, 1, 1)
     obj.data = mesh
 
-def objects_to_mesh(name: str, objects: list) -> list:
+def cube_vertices(locations: ndarray) -> ndarray:
+    """flat coordinates of the cube vertices around every location"""
+    return (locations.reshape(-1, 1, 3) - cube_data['vertices']).astype(float32).ravel()
+
+def add_cubes(mesh: bpy.types.Mesh, count: int) -> None:
+    """appends count cubes collapsed into the origin, so they stay invisible until placed"""
+    vertex_offset = len(mesh.vertices)
+    offsets = (vertex_offset + len(cube_data['vertices']) * arange(count, dtype= int32)).reshape(-1, 1, 1)
+    edges = zeros(len(mesh.edges) * 2, dtype= int32)
+    loops = zeros(len(mesh.loops), dtype= int32)
+    mesh.edges.foreach_get('vertices', edges)
+    mesh.loops.foreach_get('vertex_index', loops)
+    edges = concatenate((edges, (cube_data['edges'] + offsets).ravel()))
+    loops = concatenate((loops, (cube_data['faces'] + offsets).ravel()))
+
+    mesh.vertices.add(count * len(cube_data['vertices']))
+    mesh.edges.add(count * len(cube_data['edges']))
+    mesh.edges.foreach_set('vertices', edges)
+    add_quads(mesh, loops)
+    mesh.update()
+
+def add_quads(mesh: bpy.types.Mesh, loops: ndarray) -> None:
+    """appends quads until mesh has one for every 4 vertex indices in loops, which also holds the ones of the existing quads"""
+    mesh.loops.add(len(loops) - len(mesh.loops))
+    mesh.polygons.add(len(loops) // 4 - len(mesh.polygons))
+    mesh.loops.foreach_set('vertex_index', loops)
+    mesh.polygons.foreach_set('loop_start', arange(0, len(loops), 4, dtype= int32))
+    with suppress(AttributeError, TypeError, RuntimeError): # read only since Blender 4.0
+        mesh.polygons.foreach_set('loop_total', full(len(loops) // 4, 4, dtype= int32))
+
+def cubes_mesh(name: str, locations: ndarray) -> bpy.types.Mesh:
     mesh = bpy.data.meshes.new(name)
-    vertices = []
-    edges = []
-    faces = []
-    for obj in objects: # join objects
-        obj_mesh = obj.data
-        offset = len(vertices)
-        location = tuple(obj.location)
-        vertices += [tuple(y - x for x, y in zip(vert.co, location)) for vert in obj_mesh.vertices]
-        edges += [tuple(vert + offset for vert in edge.vertices) for edge in obj_mesh.edges]
-        faces += [tuple(vert + offset for vert in face.vertices) for face in obj_mesh.polygons]
-    mesh.from_pydata(vertices, edges, faces)
+    add_cubes(mesh, len(locations))
+    mesh.vertices.foreach_set('co', cube_vertices(array(locations, dtype= float32).reshape(-1, 3)))
+    mesh.update()
     return mesh
 
-def mesh_from_locations(mesh: bpy.types.Mesh, locations: List[Tuple]) -> None:
-    cube_data = {
-        'vertices' : [(0.5, 0.5, 0.5), (0.5, 0.5, -0.5), (0.5, -0.5, 0.5), (0.5, -0.5, -0.5), (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, -0.5, -0.5)],
-        'edges' : [(5, 7), (1, 5), (0, 1), (7, 6), (2, 3), (4, 5), (2, 6), (0, 2), (7, 3), (6, 4), (4, 0), (3, 1)],
-        'faces' : [(0, 4, 6, 2), (3, 2, 6, 7), (7, 6, 4, 5), (5, 1, 3, 7), (1, 0, 2, 3), (5, 4, 0, 1)]
-    }
-    old_vertices = [tuple(vert.co) for vert in mesh.vertices]
-    old_edges = mesh.edge_keys.copy()
-    old_faces = [tuple(face.vertices) for face in mesh.polygons]
-    old_length = len(old_vertices)
-    missing_locations = int(len(locations) - old_length / len(cube_data['vertices']))
-    # add missing geometry
-    if missing_locations > 0:
-        for location in locations[-missing_locations: ]:
-            offset = len(old_vertices)
-            old_vertices += [tuple(y - x for x, y in zip(vert, location)) for vert in cube_data['vertices']]
-            old_edges += [tuple(vert + offset for vert in edge) for edge in cube_data['edges']]
-            old_faces += [tuple(vert + offset for vert in face) for face in cube_data['faces']]
-        mesh.clear_geometry()
-        mesh.from_pydata(old_vertices, old_edges, old_faces)
-
-def apply_vertices_to_shapekey(shapekey, locations):
-    vertices = []
-    data_vertices = [(0.5, 0.5, 0.5), (0.5, 0.5, -0.5), (0.5, -0.5, 0.5), (0.5, -0.5, -0.5), (-0.5, 0.5, 0.5), (-0.5, 0.5, -0.5), (-0.5, -0.5, 0.5), (-0.5, -0.5, -0.5)]
-    for location in locations:
-        vertices += [tuple(y - x for x, y in zip(vert, location)) for vert in data_vertices]
-    for vert, location in zip(shapekey.data, vertices):
-        vert.co = location
-
-def apply_rules(locations: List[Tuple], low_value: int, high_value: int ,use_3d : bool, use_diagnol : bool, combine_planes: bool, hide: bool = False) -> List[tuple]:
-    mins = [int(min(locations, key= itemgetter(i))[i] - 2) for i in range(3)]
-    maxs = [int(max(locations, key= itemgetter(i))[i] + 3) for i in range(3)]
-    playground = zeros(tuple(i - j for i, j in zip(maxs, mins)), dtype= bool)
-    possible_locations = []
-
-    x_min, y_min, z_min = mins
-    for x, y, z in locations: # set alive celles
-        playground[x - x_min][y - y_min][z - z_min] = True
-        for xi in (-1, 0, 1):
-            for yi in (-1, 0, 1):
-                for zi in (-1, 0, 1):
-                    possible_locations.append((x + xi - x_min, y + yi - y_min, z + zi - z_min))
-    possible_locations = set(possible_locations)
-
-    alives = []
-    for i, j, k in possible_locations:
-        is_alive = playground[i][j][k]
-        count_xy = count_xz = count_yz = count_diag_xyz = count_diag_negxyz = total_count = 0
-        for l in (-1, 1):
-            x = playground[i + l][j][k]
-            y = playground[i][j + l][k]
-            xy = playground[i + l][j + l][k]
-            x_y = playground[i + l][j - l][k]
-
-            count_xy += sum((x, y, xy, x_y))
-            total_count += sum((x, y, xy, x_y))
-
-            if use_3d:
-                z = playground[i][j][k + l]
-                xz = playground[i + l][j][k + l]
-                x_z = playground[i + l][j][k - l]
-                yz = playground[i][j + l][k + l]
-                y_z = playground[i][j + l][k - l]
-
-                count_xz += sum((x, z, xz, x_z))
-                count_yz += sum((y, z, yz, y_z))
-                total_count += sum((z, xz, x_z, yz, y_z))
-                
-                if use_diagnol:
-                    xyz = playground[i + l][j + l][k + l]
-                    x_yz = playground[i + l][j - l][k + l]
-                    xy_z = playground[i + l][j + l][k - l]
-                    x_y_z = playground[i + l][j - l][k - l]
-
-                    count_diag_xyz += sum((z, xy, xyz, xy_z))
-                    count_diag_negxyz += sum((z, x_y, x_yz, x_y_z))
-                    total_count += sum((xyz, x_yz, xy_z, x_y_z))
-        if combine_planes:
-            counts = [total_count]
+def get_seed(objects) -> ndarray:
+    """unique locations of the cell objects and of the points of imported patterns"""
+    chunks = [zeros((0, 3), dtype= int32)]
+    cells = []
+    for obj in objects:
+        if obj.get(seed_property):
+            points = zeros(len(obj.data.vertices) * 3, dtype= float32)
+            obj.data.vertices.foreach_get('co', points)
+            chunks.append((points.reshape(-1, 3) + array(obj.location, dtype= float32)).round().astype(int32))
         else:
-            if use_3d:
-                if use_diagnol:
-                    counts = [count_xy, count_xz, count_yz, count_diag_xyz, count_diag_negxyz]
-                else:
-                    counts = [count_xy, count_xz, count_yz]
-            else:
-                counts = [count_xy]
+            cells.append(tuple(map(int, obj.location)))
+    chunks.append(array(cells, dtype= int32).reshape(-1, 3))
+    return unique(concatenate(chunks), axis= 0)
+
+def place_cubes(mesh: bpy.types.Mesh, start: int, locations: List[Tuple]) -> None:
+    """moves the cubes from index start on to locations"""
+    start *= len(cube_data['vertices']) * 3
+    cubes = cube_vertices(array(locations, dtype= float32).reshape(-1, 3))
+    vertices = zeros(len(mesh.vertices) * 3, dtype= float32)
+    mesh.vertices.foreach_get('co', vertices)
+    vertices[start: start + len(cubes)] = cubes
+    mesh.vertices.foreach_set('co', vertices)
+    mesh.update()
+
+def trim_cubes(mesh: bpy.types.Mesh, count: int) -> None:
+    """removes every cube after the first count ones"""
+    vertex_count = len(cube_data['vertices'])
+    if len(mesh.vertices) <= count * vertex_count:
+        return
+    vertices = zeros(len(mesh.vertices) * 3, dtype= float32)
+    mesh.vertices.foreach_get('co', vertices)
+    mesh.clear_geometry()
+    add_cubes(mesh, count)
+    mesh.vertices.foreach_set('co', vertices[ : count * vertex_count * 3])
+    mesh.update()
+
+def mesh_from_locations(mesh: bpy.types.Mesh, locations: List[Tuple], used: int) -> int:
+    """places cubes for the locations beyond the used cubes, returns the new number of used cubes
 
-        if is_alive:
-            #       Rule 3
-            alive = any(x == low_value or x == high_value for x in counts)
-            #           Rule 2                         Rule 4                                   
-            alive = not(all(x < low_value for x in counts) or any(x > high_value for x in counts))
+    the capacity of the mesh grows geometrically, unused cubes are collapsed into the origin"""
+    count = len(locations)
+    if count <= used:
+        return used
+    capacity = len(mesh.vertices) // len(cube_data['vertices'])
+    if count > capacity:
+        add_cubes(mesh, max(count, 2 * capacity) - capacity)
+    place_cubes(mesh, used, locations[used: count])
+    return count
+
+def apply_vertices_to_shapekey(shapekey: bpy.types.ShapeKey, locations: List[Tuple]) -> None:
+    """writes the cubes of locations into shapekey, repeating locations to fill all cubes of the shape key"""
+    length = len(shapekey.data) // len(cube_data['vertices'])
+    if len(locations):
+        locations = resize(array(locations, dtype= float32).reshape(-1, 3), (length, 3))
+        vertices = cube_vertices(locations)
+    else: # collapse every cube into a single invisible point
+        vertices = zeros(len(shapekey.data) * 3, dtype= float32)
+    shapekey.data.foreach_set('co', vertices)
+
+def generation_points(mesh: bpy.types.Mesh, locations) -> None:
+    """replaces the geometry of mesh with one point per cell"""
+    cells = array(locations, dtype= float32).reshape(-1, 3)
+    mesh.clear_geometry()
+    mesh.vertices.add(len(cells))
+    mesh.vertices.foreach_set('co', cells.ravel())
+    mesh.update()
+
+def generation_surfaces(mesh: bpy.types.Mesh, locations) -> None:
+    """replaces the geometry of mesh with the greedy meshed surface of the cells"""
+    vertices, faces = surface_quads(locations)
+    loops = faces.ravel()
+    mesh.clear_geometry()
+    mesh.vertices.add(len(vertices))
+    mesh.vertices.foreach_set('co', vertices.ravel())
+    add_quads(mesh, loops)
+    mesh.update(calc_edges= True)
+
+def get_instance_node_group() -> bpy.types.NodeTree:
+    """geometry nodes instancing a cube on every point"""
+    name = "Game of Life Cubes"
+    group = bpy.data.node_groups.get(name, None)
+    if group is not None:
+        return group
+    group = bpy.data.node_groups.new(name, 'GeometryNodeTree')
+    if hasattr(group, 'interface'): # Blender 4.0
+        group.interface.new_socket("Geometry", in_out= 'INPUT', socket_type= 'NodeSocketGeometry')
+        group.interface.new_socket("Geometry", in_out= 'OUTPUT', socket_type= 'NodeSocketGeometry')
+    else:
+        group.inputs.new('NodeSocketGeometry', "Geometry")
+        group.outputs.new('NodeSocketGeometry', "Geometry")
+    nodes = group.nodes
+    links = group.links
+    group_input = nodes.new('NodeGroupInput')
+    group_output = nodes.new('NodeGroupOutput')
+    cube = nodes.new('GeometryNodeMeshCube') # the size of 1 matches cube_data
+    instance = nodes.new('GeometryNodeInstanceOnPoints')
+    links.new(group_input.outputs[0], instance.inputs['Points'])
+    links.new(cube.outputs['Mesh'], instance.inputs['Instance'])
+    links.new(instance.outputs['Instances'], group_output.inputs[0])
+    for x, node in enumerate((group_input, cube, instance, group_output)):
+        node.location = (x * 200, 0)
+    return group
+
+def generation_objects(parent: bpy.types.Object, generations, output_mode: str, shown: List[int], collection: bpy.types.Collection) -> None:
+    """a child object of parent per generation, shown holds the generation visible on every frame
+
+    hidden objects aren't evaluated, so playing a frame only costs the cells of its own generation"""
+    group = get_instance_node_group() if output_mode == 'INSTANCES' else None
+    children = []
+    for index in range(len(generations)):
+        name = "%s %i" %(parent.name, index)
+        mesh = bpy.data.meshes.new(name)
+        if group is not None:
+            generation_points(mesh, generations[index])
         else:
-            #       Rule 1
-            alive = any(x == high_value for x in counts)
+            generation_surfaces(mesh, generations[index])
+        obj = bpy.data.objects.new(name, mesh)
+        obj.parent = parent
+        if group is not None:
+            obj.modifiers.new("Game of Life", 'NODES').node_group = group
+        link_to_collection(collection, obj)
+        children.append(obj)
+    previous = None
+    for frame, generation in enumerate(shown):
+        if generation == previous:
+            continue
+        # only the generations shown before and after the frame change their visibility
+        changed = children if previous is None else (children[previous], children[generation])
+        for obj in changed:
+            obj.hide_viewport = obj.hide_render = obj is not children[generation]
+            obj.keyframe_insert('hide_viewport', frame= frame + 1, group= 'Game of Life')
+            obj.keyframe_insert('hide_render', frame= frame + 1, group= 'Game of Life')
+        previous = generation
 
-        if alive:
-            location = tuple(map(int, (i + x_min, j + y_min, k + z_min)))
-            alives.append(location)
-    return alives
+def remove_result(obj: bpy.types.Object) -> None:
+    """removes a processed object together with the generation objects parented to it"""
+    for child in obj.children:
+        mesh = child.data
+        bpy.data.objects.remove(child)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    bpy.data.objects.remove(obj)
 
 classes = []
 base_case = []
-process_locations = []
+process_locations = GenerationHistory()
+
+def get_bake_cache(BGOL: bpy.types.AddonPreferences) -> BakeCache:
+    directory = bpy.path.abspath(BGOL.bake_cache_directory) if BGOL.bake_cache_directory else os.path.join(gettempdir(), "blender_game_of_life")
+    return BakeCache(directory, BGOL.bake_cache_limit * 2 ** 20)
+
+output_mode_items = [
+    ('SHAPE_KEYS', "Shape Keys", "A cube per cell moved by one shape key per generation"),
+    ('INSTANCES', "Instances", "A point set per generation with a shared cube instanced on it, only the shown generation is visible (Blender 3.2 and newer)"),
+    ('SURFACE', "Surface", "Only the exposed faces of every generation, coplanar faces merged into larger quads, in an object per generation (Blender 3.2 and newer)")
+]
+
+def get_output_mode(operator: bpy.types.Operator, BGOL: bpy.types.AddonPreferences) -> str:
+    if BGOL.output_mode != 'SHAPE_KEYS' and bpy.app.version < (3, 2, 0):
+        operator.report({'WARNING'}, "Instances and surfaces need Blender 3.2 or newer, shape keys are used instead")
+        return 'SHAPE_KEYS'
+    return BGOL.output_mode
+
+def reset_process_locations() -> None:
+    """drop the generations of the last process, a finished frame store file is closed but kept, an unfinished one removed"""
+    global process_locations
+    if isinstance(process_locations, FrameStore):
+        process_locations.close()
+    process_locations = GenerationHistory()
+profile = Profile(False)
+sweep_results = []
+sweep_setup = {}
+last_run = {}
+
+def drop_last_run() -> None:
+    """forget the run kept for Rebake, a frame store file is closed but kept"""
+    global last_run
+    generations = last_run.get('generations', None)
+    if isinstance(generations, FrameStore):
+        generations.close()
+    last_run = {}
+
+def keep_last_run(object_name: str) -> None:
+    """hands the applied generations of object_name over to Rebake as its checkpoints"""
+    global process_locations
+    if last_run.get('object_name', None) == object_name:
+        last_run['generations'] = process_locations
+        process_locations = GenerationHistory()
 
 class BGOL_PT_game_of_life(Panel):
     bl_idname = "BGOL_PT_game_of_life"
@@ -200,11 +334,15 @@ class BGOL_PT_game_of_life(Panel):
         row = main_col.row(align= True)
         row.operator(BGOL_OT_load_setup.bl_idname)
         row.operator(BGOL_OT_save_setup.bl_idname)
+        row = main_col.row(align= True)
+        row.operator(BGOL_OT_import_pattern.bl_idname)
+        row.operator(BGOL_OT_load_bake.bl_idname)
         main_col.prop(BGOL, 'object_name')
         col = main_col.column(align= True)
         row2 = col.row(align= True)
         if BGOL.progress == -1:
             row2.operator(BGOL_OT_process.bl_idname)
+            row2.operator(BGOL_OT_rebake.bl_idname, text= "", icon= 'FILE_REFRESH')
             row2.prop(BGOL, 'use_3d', text= "", icon= "OUTLINER_DATA_EMPTY")
             col2 = row2.column(align= True)
             col2.active = BGOL.use_3d
@@ -212,6 +350,21 @@ class BGOL_PT_game_of_life(Panel):
         else:
             row2.active = False
             row2.prop(BGOL, 'progress', slider= True, text= BGOL.progress_typ)
+            if BGOL.progress_typ == "Processing":
+                row3 = col.row(align= True)
+                row3.active = False
+                row3.prop(BGOL, 'progress_simulated', slider= True, text= "Simulating")
+            col.label(text= "History: %i generations, %.1f MiB" %(len(process_locations), process_locations.nbytes / 2 ** 20), icon= "MEMORY")
+        if BGOL.cycle_period > 0:
+            main_col.label(text= "Cycle: period %i from generation %i" %(BGOL.cycle_period, BGOL.cycle_start), icon= "FILE_REFRESH")
+        if BGOL.progress == -1 and profile.phases:
+            box = main_col.box()
+            col = box.column(align= True)
+            for phase, seconds, calls in profile.summary():
+                row = col.row()
+                row.label(text= phase)
+                row.label(text= "%.3f s / %i" %(seconds, calls))
+            box.operator(BGOL_OT_export_profile.bl_idname)
 classes.append(BGOL_PT_game_of_life)
 
 class BGOL_OT_cleanup_scene(Operator):
@@ -267,9 +420,10 @@ class BGOL_OT_cleanup_cells(Operator):
         mesh = get_cell_mesh(True)
         # cleanup objects
         collection = get_game_collection()
-        for obj in collection.objects:
+        objects = [obj for obj in collection.objects if not obj.get(seed_property)] # imported patterns stay point sets
+        for obj in objects:
             obj.location = [int(x) for x in obj.location]
-        sorted_objects = sorted(collection.objects, key= lambda x: tuple(x.location))
+        sorted_objects = sorted(objects, key= lambda x: tuple(x.location))
         if len(sorted_objects):
             last_obj = sorted_objects[0]
             correct_object(last_obj, mesh)
@@ -298,6 +452,11 @@ class BGOL_OT_process(Operator):
     use_3d : BoolProperty()
     use_diagonal : BoolProperty()
     combine_planes : BoolProperty()
+    engine : EnumProperty(items= engine_items)
+    output_mode : EnumProperty(items= output_mode_items)
+    sweep_index : IntProperty(default= -1, options= {'HIDDEN', 'SKIP_SAVE'}, description= "variant of the last sweep used as seed, -1 uses the cells of the collection")
+    cycle_start : IntProperty(options= {'HIDDEN'}, default= -1, description= "first generation of the detected cycle")
+    period : IntProperty(options= {'HIDDEN'}, description= "length of the detected cycle")
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
         BGOL = context.preferences.addons[__package__].preferences
@@ -308,53 +467,211 @@ class BGOL_OT_process(Operator):
         self.use_3d = BGOL.use_3d
         self.use_diagonal = BGOL.use_diagonal
         self.combine_planes = BGOL.combine_planes
+        self.engine = BGOL.engine
+        self.output_mode = get_output_mode(self, BGOL)
 
-        global process_locations
-        process_locations.clear()
+        global process_locations, profile
+        store = None
+        if BGOL.frame_store_path:
+            try:
+                store = FrameStore.create(bpy.path.abspath(BGOL.frame_store_path))
+            except OSError as error:
+                self.report({'ERROR'}, "Can't create the frame store: %s" %error)
+                return {'CANCELLED'}
+        drop_last_run()
+        reset_process_locations()
+        if store is not None:
+            process_locations = store
+        profile = Profile(BGOL.use_profiling)
         bpy.ops.bgol.save_setup()
         collection = get_game_collection()
-        process_locations.append([tuple(map(int, obj.location)) for obj in collection.objects])
-        mesh = objects_to_mesh(self.object_name, collection.objects)
+        if self.sweep_index < 0:
+            seed = get_seed(collection.objects)
+        else:
+            seed = sweep_seed(sweep_results[self.sweep_index], sweep_setup['locations'], sweep_setup['size'], sweep_setup['use_3d'], sweep_setup['seed'])
+        process_locations.append(seed)
+        self.seed = seed
+        mesh = cubes_mesh(self.object_name, seed)
         obj = bpy.data.objects.new(self.object_name, mesh)
         self.object_name = obj.name
         collection = get_finished_collection()
         link_to_collection(collection, obj)
-        self.biggest_mesh = len(process_locations[-1])
+        self.biggest_mesh = len(seed)
+        profile.record(0, cells= self.biggest_mesh)
+        self.cycle_start = -1
+        self.period = 0
+        BGOL.cycle_start = -1
+        BGOL.cycle_period = 0
         self.frame = 0
         self.length = BGOL.end_frame - BGOL.start_frame
+        self.cache_key = None
+        self.resumed = 0
         if self.length == 0:
             return self.execute(context)
+        self.start_simulation(BGOL, seed)
         self.timer = context.window_manager.event_timer_add(0.001, window= context.window)
         BGOL.progress = int(100 * self.frame / self.length)
+        BGOL.progress_simulated = 0
         BGOL.progress_typ = "Processing"
         context.window_manager.modal_handler_add(self)
         bpy.context.area.tag_redraw()
         return {'RUNNING_MODAL'}
 
+    def start_simulation(self, BGOL: bpy.types.AddonPreferences, locations: List[Tuple]) -> None:
+        """replays the generations of the bake cache and simulates the ones after them"""
+        self.worker = None
+        self.cached = iter(())
+        generations = self.length
+        seen = None
+        first = 0
+        if BGOL.bake_cache_limit:
+            cache = get_bake_cache(BGOL)
+            self.cache_key = cache.key(locations, self.value_low, self.value_high, self.use_3d, self.use_diagonal, self.combine_planes)
+            store = cache.get(self.cache_key)
+            if store is not None:
+                count = min(len(store), self.length + 1)
+                messages = [('generation', store[index], None) for index in range(1, count)]
+                cycle_start, period = store.settings['cycle_start'], store.settings['period']
+                if period and cycle_start + period <= self.length:
+                    messages.append(('cycle', cycle_start, period))
+                    generations = 0
+                else:
+                    generations = self.length - (count - 1)
+                if generations:
+                    seen = {generation_hash(store[index]): index for index in range(count - 1)}
+                    first = count - 1
+                    locations = [tuple(cell) for cell in store[count - 1].tolist()]
+                else: # the cache already holds the whole run
+                    self.cache_key = None
+                self.cached = iter(messages)
+                self.resumed = count - 1
+                self.report({'INFO'}, "%i generations from the bake cache" %self.resumed)
+        if generations == 0:
+            self.simulation = iter(())
+            return
+        args = (locations, self.value_low, self.value_high, self.use_3d, self.use_diagonal, self.combine_planes, self.engine, generations, BGOL.hashlife_cache_limit, profile.enabled, seen, first)
+        if BGOL.use_worker:
+            multiprocessing = get_context('spawn')
+            self.queue = multiprocessing.Queue()
+            self.stop = multiprocessing.Event()
+            self.simulated = multiprocessing.Value('i', 0)
+            self.worker = multiprocessing.Process(target= simulation_worker, args= (self.queue, self.stop, self.simulated, *args), daemon= True)
+            self.worker.start()
+        else:
+            self.simulation = simulate(*args)
+
+    def receive(self) -> tuple:
+        """next message of the simulation or None if there is none yet"""
+        message = next(self.cached, None)
+        if message is not None:
+            return message
+        if self.worker is None:
+            return next(self.simulation, ('done', ))
+        try:
+            return self.queue.get_nowait()
+        except Empty:
+            if not self.worker.is_alive() and self.queue.empty():
+                return ('error', "Simulation worker stopped unexpectedly")
+            return None
+
+    def stop_simulation(self) -> None:
+        worker = getattr(self, 'worker', None)
+        if worker is None:
+            return
+        self.stop.set()
+        # drain the queue, otherwise the worker can't finish putting into it
+        with suppress(Empty):
+            while worker.is_alive():
+                self.queue.get(timeout= 0.01)
+        worker.join(timeout= 1)
+        if worker.is_alive():
+            worker.terminate()
+        self.queue.close()
+        self.worker = None
+
     def modal(self, context: bpy.types.Context, event: bpy.types.Event):
         BGOL = context.preferences.addons[__package__].preferences
         global process_locations
-        self.frame += 1
-        collection = get_finished_collection()
-        obj = collection.objects[self.object_name]
-        process_locations.append(apply_rules(process_locations[-1], self.value_low, self.value_high, self.use_3d, self.use_diagonal, self.combine_planes, True))
-        last_process_locations = process_locations[-1]
-        mesh_from_locations(obj.data, last_process_locations)
-        length_last_process_locations = len(last_process_locations)
-        self.biggest_mesh = length_last_process_locations if self.biggest_mesh < length_last_process_locations else self.biggest_mesh
+        if event.type == 'ESC':
+            self.cancel(context)
+            reset_process_locations()
+            BGOL.progress = -1
+            bpy.context.area.tag_redraw()
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        deadline = perf_counter() + BGOL.time_budget / 1000
+        largest = None # the mesh only grows once per tick, to the biggest generation of the tick
+        finished = False
+        while perf_counter() < deadline:
+            message = self.receive()
+            if message is None:
+                break
+            if message[0] == 'error':
+                self.report({'ERROR'}, message[1])
+                self.cancel(context)
+                reset_process_locations()
+                BGOL.progress = -1
+                bpy.context.area.tag_redraw()
+                return {'CANCELLED'}
+            if message[0] == 'cycle': # all following generations repeat already processed ones
+                self.cycle_start, self.period = message[1:]
+                BGOL.cycle_start = self.cycle_start
+                BGOL.cycle_period = self.period
+                finished = True
+                break
+            if message[0] == 'done':
+                finished = True
+                break
+            self.frame += 1
+            locations = message[1]
+            process_locations.append(locations)
+            stats = message[2]
+            if stats is not None:
+                profile.add('simulation', self.frame, stats['simulation'])
+                profile.record(self.frame, cells= len(locations), allocated= stats['allocated'])
+            if largest is None or len(locations) > len(largest):
+                largest = locations
+            if self.frame == self.length:
+                finished = True
+                break
+        if largest is not None and self.output_mode == 'SHAPE_KEYS':
+            obj = get_finished_collection().objects[self.object_name]
+            with profile.measure('mesh_from_locations', self.frame):
+                self.biggest_mesh = mesh_from_locations(obj.data, largest, self.biggest_mesh)
+        if finished:
+            return self.execute(context)
         BGOL.progress = int(100 * self.frame / self.length)
+        BGOL.progress_simulated = int(100 * (self.resumed + self.simulated.value if self.worker else self.frame) / self.length)
         bpy.context.area.tag_redraw()
-        if self.frame == self.length:
-            return self.execute(context)
         return {'PASS_THROUGH'}
 
     def execute(self, context: bpy.types.Context):
         self.cancel(context)
-        bpy.ops.bgol.apply_process('INVOKE_DEFAULT', biggest_mesh= self.biggest_mesh, object_name= self.object_name)
+        if isinstance(process_locations, FrameStore):
+            process_locations.finish(
+                frames= self.length + 1, cycle_start= self.cycle_start, period= self.period, value_low= self.value_low, value_high= self.value_high,
+                use_3d= self.use_3d, use_diagonal= self.use_diagonal, combine_planes= self.combine_planes, engine= self.engine
+            )
+        if self.cache_key:
+            BGOL = context.preferences.addons[__package__].preferences
+            get_bake_cache(BGOL).put(
+                self.cache_key, process_locations, frames= self.frame + 1, cycle_start= self.cycle_start, period= self.period, value_low= self.value_low,
+                value_high= self.value_high, use_3d= self.use_3d, use_diagonal= self.use_diagonal, combine_planes= self.combine_planes
+            )
+        global last_run
+        last_run = dict(
+            object_name= self.object_name, rules= (self.value_low, self.value_high, self.use_3d, self.use_diagonal, self.combine_planes),
+            frames= self.length + 1, cycle_start= self.cycle_start, period= self.period, output_mode= self.output_mode, seed= self.seed
+        )
+        collection = get_finished_collection()
+        trim_cubes(collection.objects[self.object_name].data, self.biggest_mesh)
+        bpy.ops.bgol.apply_process('INVOKE_DEFAULT', biggest_mesh= self.biggest_mesh, object_name= self.object_name, frames= self.length + 1, cycle_start= self.cycle_start, period= self.period, output_mode= self.output_mode)
         return {'FINISHED'}
 
     def cancel(self, context):
-        with suppress():
+        self.stop_simulation()
+        with suppress(AttributeError): # no timer when nothing had to be processed
             context.window_manager.event_timer_remove(self.timer)
 classes.append(BGOL_OT_process)
 
@@ -368,25 +685,33 @@ class BGOL_OT_apply_process(Operator):
     length : IntProperty(options= {'HIDDEN'})
     biggest_mesh : IntProperty(options= {'HIDDEN'}, description= "saves length of of mesh with max locations")
     object_name : StringProperty(options= {'HIDDEN'})
+    frames : IntProperty(options= {'HIDDEN'}, description= "number of generations to show, including the ones repeated by the cycle")
+    cycle_start : IntProperty(options= {'HIDDEN'}, default= -1)
+    period : IntProperty(options= {'HIDDEN'})
+    output_mode : EnumProperty(items= output_mode_items, options= {'HIDDEN'})
 
     def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
         BGOL = context.preferences.addons[__package__].preferences
         global process_locations
-        max_length = self.biggest_mesh
         collection = get_finished_collection()
         obj = collection.objects[self.object_name]
-        shape_key = obj.shape_key_add(name= "Basis", from_mix= False)
+        self.length = len(process_locations)
+        if self.output_mode != 'SHAPE_KEYS':
+            self.apply_generations(obj)
+            keep_last_run(self.object_name)
+            self.cancel(context)
+            return {'FINISHED'}
+        with profile.measure('shape_key_add', 0):
+            shape_key = obj.shape_key_add(name= "Basis", from_mix= False)
         shape_key.interpolation = 'KEY_LINEAR'
-        locations = process_locations[0]
-        length = len(locations)
-        locations = locations * int(max_length / length) + locations[ : max_length % length]
-        apply_vertices_to_shapekey(shape_key, locations)
+        with profile.measure('apply_vertices_to_shapekey', 0):
+            apply_vertices_to_shapekey(shape_key, process_locations[0])
         shape_keys = obj.data.shape_keys
         shape_keys.use_relative = False
         shape_keys.eval_time = shape_key.frame
-        shape_keys.keyframe_insert('eval_time', frame= 1, group= 'Game of Life')
+        with profile.measure('keyframe_insert', 0):
+            shape_keys.keyframe_insert('eval_time', frame= 1, group= 'Game of Life')
 
-        self.length = len(process_locations)
         self.index = 0
         if self.length <= 1:
             return self.execute(context)
@@ -401,41 +726,165 @@ class BGOL_OT_apply_process(Operator):
     def modal(self, context: bpy.types.Context, event: bpy.types.Event):
         BGOL = context.preferences.addons[__package__].preferences
         global process_locations
-        max_length = self.biggest_mesh
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        deadline = perf_counter() + BGOL.time_budget / 1000
         collection = get_finished_collection()
         obj = collection.objects[self.object_name]
-        self.index += 1
-        i = self.index + 1
-        locations = process_locations[self.index]
-        length = len(locations)
-        locations = locations * int(max_length / length) + locations[ : max_length % length]
-        shape_key = obj.shape_key_add(name= "Frame %i" %i, from_mix= False)
-        shape_key.interpolation = 'KEY_LINEAR'
-        apply_vertices_to_shapekey(shape_key, locations)
         shape_keys = obj.data.shape_keys
-        shape_keys.eval_time = shape_key.frame
-        shape_keys.keyframe_insert('eval_time', frame= i, group= 'Game of Life')
-        
+        while perf_counter() < deadline:
+            self.index += 1
+            i = self.index + 1
+            with profile.measure('shape_key_add', self.index):
+                shape_key = obj.shape_key_add(name= "Frame %i" %i, from_mix= False)
+            shape_key.interpolation = 'KEY_LINEAR'
+            with profile.measure('apply_vertices_to_shapekey', self.index):
+                apply_vertices_to_shapekey(shape_key, process_locations[self.index])
+            shape_keys.eval_time = shape_key.frame
+            with profile.measure('keyframe_insert', self.index):
+                shape_keys.keyframe_insert('eval_time', frame= i, group= 'Game of Life')
+            if i >= self.length:
+                return self.execute(context)
+
         BGOL.progress = int(100 * self.index / self.length)
         bpy.context.area.tag_redraw()
-        if i >= self.length:
-            return self.execute(context)
         return {'PASS_THROUGH'}
 
     def execute(self, context: bpy.types.Context):
+        collection = get_finished_collection()
+        self.reuse_cycle(collection.objects[self.object_name])
+        keep_last_run(self.object_name)
         self.cancel(context)
         return {'FINISHED'}
 
+    def get_generation(self, frame: int) -> int:
+        """processed generation shown on frame, counted from 0"""
+        if frame < self.length:
+            return frame
+        if self.period > 0:
+            return self.cycle_start + (frame - self.cycle_start) % self.period
+        return self.length - 1
+
+    def apply_generations(self, obj: bpy.types.Object) -> None:
+        """an object per generation parented to obj, each one only visible on the frames showing its generation"""
+        shown = [self.get_generation(frame) for frame in range(max(self.frames, self.length))]
+        with profile.measure('generation_objects', 0):
+            generation_objects(obj, process_locations, self.output_mode, shown, get_finished_collection())
+
+    def reuse_cycle(self, obj: bpy.types.Object) -> None:
+        """keyframe the generations after the processed ones to the shape keys of the cycle"""
+        if self.period <= 0:
+            return
+        shape_keys = obj.data.shape_keys
+        for generation in range(self.length, self.frames):
+            shape_key = shape_keys.key_blocks[self.get_generation(generation)]
+            shape_keys.eval_time = shape_key.frame
+            with profile.measure('keyframe_insert', generation):
+                shape_keys.keyframe_insert('eval_time', frame= generation + 1, group= 'Game of Life')
+
     def cancel(self, context):
-        global process_locations
-        process_locations.clear()
+        reset_process_locations()
         BGOL = context.preferences.addons[__package__].preferences
-        with suppress():
+        with suppress(AttributeError): # no timer when nothing had to be processed
             context.window_manager.event_timer_remove(self.timer)
         BGOL.progress = -1
         bpy.context.area.tag_redraw()
 classes.append(BGOL_OT_apply_process)
 
+class BGOL_OT_rebake(Operator):
+    bl_idname = "bgol.rebake"
+    bl_label = "Rebake"
+    bl_description = "Process the edited setup again, only simulating where the changed cells can reach and only rewriting the frames that changed"
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context):
+        return last_run.get('generations', None) is not None
+
+    def execute(self, context: bpy.types.Context):
+        BGOL = context.preferences.addons[__package__].preferences
+        if BGOL.progress != -1:
+            self.report({'ERROR'}, "A game is already processing")
+            return {'CANCELLED'}
+        rules = (BGOL.value_low, BGOL.value_high, BGOL.use_3d, BGOL.use_diagonal, BGOL.combine_planes)
+        collection = get_finished_collection()
+        generations = last_run['generations']
+        if last_run['rules'] != rules or last_run['frames'] != BGOL.end_frame - BGOL.start_frame + 1 or last_run['object_name'] not in collection.objects:
+            return self.process_all("Rules or frames changed since the last process")
+        bpy.ops.bgol.save_setup()
+        seed = get_seed(get_game_collection().objects)
+        try:
+            if not len(cell_difference(seed, last_run['seed'])):
+                self.report({'INFO'}, "The setup didn't change since the last process")
+                return {'FINISHED'}
+            history = GenerationHistory()
+            changed = []
+            biggest_mesh = 0
+            seen = {}
+            cycle = None # first repeated generation of the new run, the bake cache only takes the ones before it
+            for index, (cells, is_changed) in enumerate(rebake(generations, seed, *rules)):
+                history.append(cells)
+                biggest_mesh = max(biggest_mesh, len(cells))
+                if is_changed:
+                    changed.append(index)
+                if cycle is None:
+                    generation = generation_hash(cells)
+                    if generation in seen:
+                        cycle = (index, seen[generation], index - seen[generation])
+                    seen[generation] = index
+        except ValueError as error:
+            return self.process_all(str(error))
+        # the frames after the processed ones only repeat the cycle if both its ends are unchanged
+        if last_run['period'] > 0 and (last_run['cycle_start'] in changed or len(history) - 1 in changed):
+            return self.process_all("The cycle changed")
+        if BGOL.bake_cache_limit:
+            length, cycle_start, period = cycle or (len(history), last_run['cycle_start'], last_run['period'])
+            cache = get_bake_cache(BGOL)
+            cache.put(
+                cache.key(seed, *rules), history, length= length, frames= length, cycle_start= cycle_start, period= period,
+                value_low= rules[0], value_high= rules[1], use_3d= rules[2], use_diagonal= rules[3], combine_planes= rules[4]
+            )
+        if isinstance(generations, FrameStore):
+            generations.close()
+        last_run['generations'] = history
+        last_run['seed'] = seed
+
+        obj = collection.objects[last_run['object_name']]
+        shape_keys = obj.data.shape_keys
+        if (
+            last_run['output_mode'] == 'SHAPE_KEYS' and shape_keys is not None and len(shape_keys.key_blocks) >= len(history)
+            and biggest_mesh <= len(obj.data.vertices) // len(cube_data['vertices'])
+        ):
+            for index in changed:
+                apply_vertices_to_shapekey(shape_keys.key_blocks[index], history[index])
+            obj.data.update()
+            self.report({'INFO'}, "%i of %i generations rewritten" %(len(changed), len(history)))
+            return {'FINISHED'}
+
+        # the geometry has to be built again, but the simulation is still skipped
+        global process_locations
+        name = obj.name
+        remove_result(obj)
+        reset_process_locations()
+        process_locations = history # handed back to last_run once applied
+        last_run['generations'] = None
+        mesh = bpy.data.meshes.new(name)
+        if last_run['output_mode'] == 'SHAPE_KEYS':
+            add_cubes(mesh, biggest_mesh)
+        obj = bpy.data.objects.new(name, mesh)
+        link_to_collection(collection, obj)
+        last_run['object_name'] = obj.name
+        bpy.ops.bgol.apply_process(
+            'INVOKE_DEFAULT', biggest_mesh= biggest_mesh, object_name= obj.name, frames= last_run['frames'],
+            cycle_start= last_run['cycle_start'], period= last_run['period'], output_mode= last_run['output_mode']
+        )
+        return {'FINISHED'}
+
+    def process_all(self, reason: str):
+        self.report({'INFO'}, "%s, processing everything" %reason)
+        bpy.ops.bgol.process('INVOKE_DEFAULT')
+        return {'FINISHED'}
+classes.append(BGOL_OT_rebake)
+
 class BGOL_OT_save_setup(Operator):
     bl_idname = "bgol.save_setup"
     bl_label = "Save Setup"
@@ -446,22 +895,296 @@ class BGOL_OT_save_setup(Operator):
         BGOL = context.preferences.addons[__package__].preferences
         collection = get_game_collection()
         global base_case
-        base_case = [tuple(int(x) for x in obj.location) for obj in collection.objects if not obj.hide_get()]
+        base_case = list(map(tuple, get_seed(obj for obj in collection.objects if not obj.hide_get()).tolist()))
         return {'FINISHED'}
 classes.append(BGOL_OT_save_setup)
 
 class BGOL_OT_load_setup(Operator):
     bl_idname = "bgol.load_setup"
     bl_label = "Load Setup"
-    bl_description = "Load the saved setup"
+    bl_description = "Load the saved setup as one point set"
 
     def execute(self, context: bpy.types.Context):
         global base_case
-        for location in base_case:
-            create_cell(location)
+        if base_case:
+            create_point_set("Setup", array(base_case, dtype= int32))
         return {'FINISHED'}
 classes.append(BGOL_OT_load_setup)
 
+class BGOL_OT_import_pattern(Operator, ImportHelper):
+    bl_idname = "bgol.import_pattern"
+    bl_label = "Import Pattern"
+    bl_description = "Import a Golly RLE, plaintext (.cells) or occupancy array (.npy) pattern as a single point set in the 'Game of Life' collection"
+
+    filename_ext = ".rle"
+    check_extension = None
+    filter_glob : StringProperty(default= "*.rle;*.cells;*.npy;*.txt", options= {'HIDDEN'})
+
+    def execute(self, context: bpy.types.Context):
+        try:
+            cells = read_pattern(self.filepath)
+        except (OSError, ValueError) as error:
+            self.report({'ERROR'}, str(error))
+            return {'CANCELLED'}
+        name = os.path.splitext(os.path.basename(self.filepath))[0]
+        create_point_set(name, cells, [round(x) for x in context.scene.cursor.location])
+        self.report({'INFO'}, "%i cells imported" %len(cells))
+        return {'FINISHED'}
+classes.append(BGOL_OT_import_pattern)
+
+class BGOL_OT_load_bake(Operator, ImportHelper):
+    bl_idname = "bgol.load_bake"
+    bl_label = "Load Bake"
+    bl_description = "Load generations simulated with the command line (game_of_life.py) or kept in a frame store and apply them"
+
+    filename_ext = ".npz"
+    check_extension = None
+    filter_glob : StringProperty(default= "*.npz;*.frames", options= {'HIDDEN'})
+    first_generation : IntProperty(name= "First Generation", default= 0, min= 0)
+    last_generation : IntProperty(name= "Last Generation", default= -1, min= -1, description= "last applied generation, -1 for all")
+
+    def execute(self, context: bpy.types.Context):
+        BGOL = context.preferences.addons[__package__].preferences
+        if BGOL.progress != -1:
+            self.report({'ERROR'}, "A game is already processing")
+            return {'CANCELLED'}
+        global process_locations, profile
+        try:
+            if self.filepath.endswith('.frames'): # applied straight from the memory map
+                generations = FrameStore(self.filepath)
+                settings = generations.settings
+            else:
+                generations, settings = load_generations(self.filepath)
+            settings = dict(frames= settings['frames'], cycle_start= settings['cycle_start'], period= settings['period'])
+        except (OSError, ValueError, KeyError, struct_error, BadZipFile) as error:
+            self.report({'ERROR'}, "Can't load the bake: %s" %error)
+            return {'CANCELLED'}
+        stop = None if self.last_generation == -1 else self.last_generation + 1
+        if self.first_generation or stop is not None: # a sub-range doesn't continue into the cycle
+            settings = dict(settings, cycle_start= -1, period= 0)
+            generations = generations.subrange(self.first_generation, stop) if isinstance(generations, FrameStore) else generations[self.first_generation: stop]
+            settings['frames'] = len(generations)
+        if not len(generations):
+            if isinstance(generations, FrameStore):
+                generations.close()
+            self.report({'ERROR'}, "No generations in the selected range")
+            return {'CANCELLED'}
+        # the loaded bake replaces the last run only once it could be read
+        drop_last_run()
+        reset_process_locations()
+        if isinstance(generations, FrameStore):
+            process_locations = generations
+        else:
+            for locations in generations:
+                process_locations.append(locations)
+        profile = Profile(BGOL.use_profiling)
+        biggest_mesh = max(map(len, generations))
+        output_mode = get_output_mode(self, BGOL)
+        mesh = bpy.data.meshes.new(BGOL.object_name)
+        if output_mode == 'SHAPE_KEYS':
+            add_cubes(mesh, biggest_mesh)
+        obj = bpy.data.objects.new(BGOL.object_name, mesh)
+        link_to_collection(get_finished_collection(), obj)
+        BGOL.cycle_start = settings['cycle_start']
+        BGOL.cycle_period = settings['period']
+        bpy.ops.bgol.apply_process('INVOKE_DEFAULT', biggest_mesh= biggest_mesh, object_name= obj.name, frames= settings['frames'], cycle_start= settings['cycle_start'], period= settings['period'], output_mode= output_mode)
+        return {'FINISHED'}
+classes.append(BGOL_OT_load_bake)
+
+def parse_values(text: str, cast) -> list:
+    return [cast(value) for value in text.split(',') if value.strip()]
+
+toggle_values = {
+    'BOTH' : [False, True],
+    'ON' : [True],
+    'OFF' : [False]
+}
+toggle_items = [
+    ('BOTH', "Both", "Run every variant with and without it"),
+    ('ON', "On", "Run every variant with it"),
+    ('OFF', "Off", "Run every variant without it")
+]
+
+class BGOL_OT_sweep(Operator):
+    bl_idname = "bgol.sweep"
+    bl_label = "Run Sweep"
+    bl_description = "Simulate every combination of the sweep values in a process pool and rank the runs"
+
+    def invoke(self, context: bpy.types.Context, event: bpy.types.Event):
+        BGOL = context.preferences.addons[__package__].preferences
+        if BGOL.progress != -1:
+            self.report({'ERROR'}, "A game is already processing")
+            return {'CANCELLED'}
+        try:
+            densities = parse_values(BGOL.sweep_densities, float)
+            variants = sweep_variants(
+                parse_values(BGOL.sweep_low_values, int), parse_values(BGOL.sweep_high_values, int),
+                toggle_values[BGOL.sweep_diagonal], toggle_values[BGOL.sweep_combine_planes], densities
+            )
+        except ValueError as error:
+            self.report({'ERROR'}, "Sweep values must be separated by commas: %s" %error)
+            return {'CANCELLED'}
+        if not variants:
+            self.report({'ERROR'}, "The sweep has no variants")
+            return {'CANCELLED'}
+        global sweep_results, sweep_setup
+        sweep_results = []
+        # random soups don't need the cells of the collection
+        sweep_setup = dict(locations= get_seed(get_game_collection().objects) if not densities or min(densities) <= 0 else None, size= BGOL.sweep_size, use_3d= BGOL.use_3d, seed= BGOL.sweep_seed)
+        self.pool = get_context('spawn').Pool(BGOL.sweep_processes or None)
+        self.pending = [
+            self.pool.apply_async(run_variant, (variant, sweep_setup['locations'], sweep_setup['size'], sweep_setup['use_3d'], sweep_setup['seed'], BGOL.sweep_generations, BGOL.engine))
+            for variant in variants
+        ]
+        self.total = len(variants)
+        self.timer = context.window_manager.event_timer_add(0.1, window= context.window)
+        BGOL.progress = 0
+        BGOL.progress_typ = "Sweeping"
+        context.window_manager.modal_handler_add(self)
+        bpy.context.area.tag_redraw()
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context: bpy.types.Context, event: bpy.types.Event):
+        BGOL = context.preferences.addons[__package__].preferences
+        if event.type == 'ESC':
+            self.cancel(context)
+            return {'CANCELLED'}
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+        for result in [result for result in self.pending if result.ready()]:
+            self.pending.remove(result)
+            try:
+                sweep_results.append(result.get())
+            except Exception as error:
+                self.report({'ERROR'}, "Sweep variant failed: %s" %error)
+                self.cancel(context)
+                return {'CANCELLED'}
+        if not self.pending:
+            sweep_results[:] = rank_variants(sweep_results, BGOL.sweep_ranking)
+            self.cancel(context)
+            return {'FINISHED'}
+        BGOL.progress = int(100 * (self.total - len(self.pending)) / self.total)
+        bpy.context.area.tag_redraw()
+        return {'PASS_THROUGH'}
+
+    def cancel(self, context):
+        self.pool.terminate()
+        with suppress(AttributeError):
+            context.window_manager.event_timer_remove(self.timer)
+        BGOL = context.preferences.addons[__package__].preferences
+        BGOL.progress = -1
+        bpy.context.area.tag_redraw()
+classes.append(BGOL_OT_sweep)
+
+class BGOL_OT_apply_sweep_variant(Operator):
+    bl_idname = "bgol.apply_sweep_variant"
+    bl_label = "Apply Variant"
+    bl_description = "Take over the rules of the variant and process it with its seed"
+
+    index : IntProperty(options= {'HIDDEN'})
+
+    def execute(self, context: bpy.types.Context):
+        BGOL = context.preferences.addons[__package__].preferences
+        if BGOL.progress != -1:
+            self.report({'ERROR'}, "A game is already processing")
+            return {'CANCELLED'}
+        variant = sweep_results[self.index]
+        BGOL.value_low = variant['value_low']
+        BGOL.value_high = variant['value_high']
+        BGOL.use_diagonal = variant['use_diagonal']
+        BGOL.combine_planes = variant['combine_planes']
+        BGOL.use_3d = sweep_setup['use_3d']
+        bpy.ops.bgol.process('INVOKE_DEFAULT', sweep_index= self.index)
+        return {'FINISHED'}
+classes.append(BGOL_OT_apply_sweep_variant)
+
+def describe_variant(result: dict) -> Tuple[str, str]:
+    """rules and seed, and outcome of a sweep run"""
+    rules = "%i/%i%s%s %s" %(
+        result['value_low'], result['value_high'], " diagonal" if result['use_diagonal'] else "", " combined" if result['combine_planes'] else "",
+        "%g%%" %(result['density'] * 100) if result['density'] > 0 else "seed"
+    )
+    if result['extinct'] != -1:
+        outcome = "dies at %i" %result['extinct']
+    elif result['period']:
+        outcome = "period %i from %i" %(result['period'], result['cycle_start'])
+    else:
+        outcome = "alive"
+    return rules, "%s, %i cells, %.1fx" %(outcome, result['population'][-1], result['growth'])
+
+class BGOL_PT_sweep(Panel):
+    bl_idname = "BGOL_PT_sweep"
+    bl_label = "Sweep"
+    bl_category = "Game"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_parent_id = "BGOL_PT_game_of_life"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context: bpy.types.Context):
+        layout = self.layout
+        BGOL = context.preferences.addons[__package__].preferences
+        col = layout.column(align= True)
+        col.prop(BGOL, 'sweep_low_values')
+        col.prop(BGOL, 'sweep_high_values')
+        col.prop(BGOL, 'sweep_diagonal')
+        col.prop(BGOL, 'sweep_combine_planes')
+        col.prop(BGOL, 'sweep_densities')
+        col = layout.column(align= True)
+        col.prop(BGOL, 'sweep_size')
+        col.prop(BGOL, 'sweep_seed')
+        col.prop(BGOL, 'sweep_generations')
+        col.prop(BGOL, 'sweep_processes')
+        if BGOL.progress == -1:
+            layout.operator(BGOL_OT_sweep.bl_idname)
+        if not sweep_results:
+            return
+        row = layout.row(align= True)
+        row.prop(BGOL, 'sweep_ranking')
+        row.prop(BGOL, 'sweep_shown', text= "")
+        box = layout.box()
+        col = box.column(align= True)
+        for index, result in enumerate(sweep_results[: BGOL.sweep_shown]):
+            rules, outcome = describe_variant(result)
+            row = col.row()
+            row.label(text= rules)
+            row.label(text= outcome)
+            row.enabled = BGOL.progress == -1
+            row.operator(BGOL_OT_apply_sweep_variant.bl_idname, text= "", icon= 'PLAY').index = index
+classes.append(BGOL_PT_sweep)
+
+class BGOL_OT_export_profile(Operator, ExportHelper):
+    bl_idname = "bgol.export_profile"
+    bl_label = "Export Profile"
+    bl_description = "Export the time of every phase per generation of the last process (.json or .csv)"
+
+    filename_ext = ".json"
+    check_extension = None
+    filter_glob : StringProperty(default= "*.json;*.csv", options= {'HIDDEN'})
+
+    @classmethod
+    def poll(cls, context: bpy.types.Context):
+        return bool(profile.phases)
+
+    def execute(self, context: bpy.types.Context):
+        profile.save(self.filepath)
+        return {'FINISHED'}
+classes.append(BGOL_OT_export_profile)
+
+class BGOL_OT_clear_bake_cache(Operator):
+    bl_idname = "bgol.clear_bake_cache"
+    bl_label = "Clear Bake Cache"
+    bl_description = "Remove all cached runs"
+
+    def execute(self, context: bpy.types.Context):
+        BGOL = context.preferences.addons[__package__].preferences
+        get_bake_cache(BGOL).clear()
+        return {'FINISHED'}
+classes.append(BGOL_OT_clear_bake_cache)
+
+def rank_sweep(self, context: bpy.types.Context) -> None:
+    sweep_results[:] = rank_variants(sweep_results, self.sweep_ranking)
+
 class BGOL_preferences(AddonPreferences):
     bl_idname = __package__
 
@@ -480,16 +1203,54 @@ class BGOL_preferences(AddonPreferences):
     use_3d : BoolProperty(default= False, name= "Use 3D", description= "Turn off to only use 2 dimension (normal Conway's Game of Life)")
     use_diagonal : BoolProperty(default= True, name= "Use Diagonal", description= "Also use diagnal plans to calculate the game")
     combine_planes : BoolProperty(default= False, name= "Combine Planes")
+    engine : EnumProperty(items= engine_items, name= "Engine", description= "Simulation used to process the game", default= 'DENSE')
+    output_mode : EnumProperty(items= output_mode_items, name= "Output", description= "Geometry of the processed game", default= 'SHAPE_KEYS')
+    hashlife_cache_limit : IntProperty(name= "Hashlife Cache", description= "Maximum of stored Hashlife nodes before the cache is cleared and rebuild", default= 500000, min= 1000)
     value_low : IntProperty(name= "low value", default= 2)
     value_high : IntProperty(name= "high value", default= 3)
     object_name : StringProperty(name= "Processed Name", description= "Name for the processed game", default= "Processed")
     progress_typ : StringProperty()
+    progress_simulated : IntProperty(name= "Simulated", default= 0, min= 0, max= 100, subtype= 'PERCENTAGE')
+    use_profiling : BoolProperty(default= False, name= "Use Profiling", description= "Record the time of every phase per generation, shown in the panel after processing")
+    time_budget : IntProperty(name= "Time Budget", default= 30, min= 1, description= "Milliseconds the processing may take before the interface is updated")
+    use_worker : BoolProperty(default= True, name= "Use Worker", description= "Simulate in a separate process, so the simulation doesn't wait on the interface")
+    bake_cache_limit : IntProperty(name= "Bake Cache", default= 512, min= 0, subtype= 'UNSIGNED', description= "MiB of processed runs kept to reuse them for the same seed and rules, the least recently used are removed first. 0 disables the cache")
+    bake_cache_directory : StringProperty(name= "Bake Cache Directory", subtype= 'DIR_PATH', default= "", description= "Directory of the bake cache, empty uses the temporary directory")
+    frame_store_path : StringProperty(name= "Frame Store", subtype= 'FILE_PATH', default= "", description= "File the generations are streamed to while processing instead of keeping them in memory, can be applied again with 'Load Bake'. Empty keeps them in memory")
+    sweep_low_values : StringProperty(name= "Low Values", default= "2, 3, 4", description= "low values of the sweep, separated by commas")
+    sweep_high_values : StringProperty(name= "High Values", default= "3, 4, 5", description= "high values of the sweep, separated by commas")
+    sweep_diagonal : EnumProperty(items= toggle_items, name= "Diagonal", default= 'BOTH')
+    sweep_combine_planes : EnumProperty(items= toggle_items, name= "Combine Planes", default= 'OFF')
+    sweep_densities : StringProperty(name= "Densities", default= "0.1, 0.2, 0.3", description= "densities of the random seeds, separated by commas. Empty uses the cells of the collection")
+    sweep_size : IntProperty(name= "Seed Size", default= 16, min= 1, description= "width of the square or cube of the random seeds")
+    sweep_seed : IntProperty(name= "Random Seed", default= 0, min= 0)
+    sweep_generations : IntProperty(name= "Generations", default= 100, min= 1)
+    sweep_processes : IntProperty(name= "Processes", default= 0, min= 0, description= "simulations running at once, 0 uses all cores")
+    sweep_ranking : EnumProperty(items= sweep_ranking_items, name= "Ranking", default= 'LIFETIME', update= rank_sweep)
+    sweep_shown : IntProperty(name= "Shown Variants", default= 10, min= 1)
+    cycle_start : IntProperty(name= "Cycle Start", default= -1, description= "first generation of the cycle found by the last process")
+    cycle_period : IntProperty(name= "Cycle Period", default= 0, description= "period of the cycle found by the last process, 0 if none was found")
 
     def draw(self, context):
         layout = self.layout
         layout.prop(self, 'combine_planes')
         layout.prop(self, 'value_low')
         layout.prop(self, 'value_high')
+        layout.prop(self, 'engine')
+        layout.prop(self, 'output_mode')
+        layout.prop(self, 'use_worker')
+        layout.prop(self, 'time_budget')
+        layout.prop(self, 'frame_store_path')
+        row = layout.row()
+        row.prop(self, 'bake_cache_limit')
+        row.operator('bgol.clear_bake_cache', text= "", icon= 'TRASH')
+        row = layout.row()
+        row.active = self.bake_cache_limit > 0
+        row.prop(self, 'bake_cache_directory')
+        layout.prop(self, 'use_profiling')
+        row = layout.row()
+        row.active = self.engine == 'HASHLIFE'
+        row.prop(self, 'hashlife_cache_limit')
 classes.append(BGOL_preferences)
 
 def register():
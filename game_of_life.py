@@ -0,0 +1,1016 @@
+from numpy import zeros, ones, full, empty, array, argwhere, where, nonzero, diff, unique, concatenate, lexsort, cumsum, split, setdiff1d, union1d, setxor1d, load, savez_compressed, memmap, frombuffer, unpackbits, bitwise_or, ndarray, int8, uint8, uint64, int32, int64, float32
+from numpy.random import default_rng
+from itertools import product
+from hashlib import blake2b
+from typing import Tuple, List, Dict, Iterator, Optional
+from traceback import format_exc
+from contextlib import contextmanager, nullcontext, suppress
+from time import perf_counter
+from struct import Struct, error as struct_error
+from copy import copy
+from array import array as array_buffer
+import os
+import json
+import csv
+import sys
+
+neighbor_offsets = {
+    'xy' : [(l, 0, 0) for l in (-1, 1)] + [(0, l, 0) for l in (-1, 1)] + [(l, l, 0) for l in (-1, 1)] + [(l, -l, 0) for l in (-1, 1)],
+    'xz' : [(l, 0, 0) for l in (-1, 1)] + [(0, 0, l) for l in (-1, 1)] + [(l, 0, l) for l in (-1, 1)] + [(l, 0, -l) for l in (-1, 1)],
+    'yz' : [(0, l, 0) for l in (-1, 1)] + [(0, 0, l) for l in (-1, 1)] + [(0, l, l) for l in (-1, 1)] + [(0, l, -l) for l in (-1, 1)],
+    'diag_xyz' : [(0, 0, l) for l in (-1, 1)] + [(l, l, 0) for l in (-1, 1)] + [(l, l, l) for l in (-1, 1)] + [(l, l, -l) for l in (-1, 1)],
+    'diag_negxyz' : [(0, 0, l) for l in (-1, 1)] + [(l, -l, 0) for l in (-1, 1)] + [(l, -l, l) for l in (-1, 1)] + [(l, -l, -l) for l in (-1, 1)]
+}
+
+def get_planes(use_3d : bool, use_diagnol : bool, combine_planes: bool) -> List[List[Tuple]]:
+    if use_3d:
+        if use_diagnol:
+            planes = [neighbor_offsets[name] for name in ('xy', 'xz', 'yz', 'diag_xyz', 'diag_negxyz')]
+        else:
+            planes = [neighbor_offsets[name] for name in ('xy', 'xz', 'yz')]
+    else:
+        planes = [neighbor_offsets['xy']]
+    if combine_planes:
+        planes = [sorted(set(offset for plane in planes for offset in plane))]
+    return planes
+
+def count_neighbors(padded: ndarray, offsets: List[Tuple]) -> ndarray:
+    *batch, x, y, z = padded.shape
+    x, y, z = x - 2, y - 2, z - 2
+    count = zeros((*batch, x, y, z), dtype= uint8)
+    for i, j, k in offsets:
+        count += padded[..., 1 + i: 1 + i + x, 1 + j: 1 + j + y, 1 + k: 1 + k + z]
+    return count
+
+def next_state(padded: ndarray, low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool) -> ndarray:
+    """calculates the next state of all cells inside the one cell wide border of the last 3 axes of padded"""
+    is_alive = padded[..., 1:-1, 1:-1, 1:-1]
+    # only cells next to an alive cell can change
+    near = padded[..., :-2, :, :] | padded[..., 1:-1, :, :] | padded[..., 2:, :, :]
+    near = near[..., :-2, :] | near[..., 1:-1, :] | near[..., 2:, :]
+    near = near[..., :-2] | near[..., 1:-1] | near[..., 2:]
+
+    all_low = ones(is_alive.shape, dtype= bool)
+    any_high = zeros(is_alive.shape, dtype= bool)
+    born = zeros(is_alive.shape, dtype= bool)
+    for offsets in get_planes(use_3d, use_diagnol, combine_planes):
+        count = count_neighbors(padded, offsets)
+        all_low &= count < low_value
+        any_high |= count > high_value
+        born |= count == high_value
+    #                         Rule 2       Rule 4                 Rule 1
+    return near & where(is_alive, ~(all_low | any_high), born)
+
+def create_playground(locations: List[Tuple]) -> Tuple[ndarray, ndarray]:
+    """playground of the locations with an empty border of two cells and the location of its first cell"""
+    cells = array(locations, dtype= int64).reshape(-1, 3)
+    mins = cells.min(axis= 0) - 2
+    maxs = cells.max(axis= 0) + 3
+    playground = zeros(tuple(maxs - mins), dtype= bool)
+    playground[tuple((cells - mins).T)] = True
+    return playground, mins
+
+def surface_quads(locations: List[Tuple]) -> Tuple[ndarray, ndarray]:
+    """vertices and quads of the exposed faces of the cubes around the locations
+
+    coplanar faces are merged greedily, first into runs along a row, then runs with the same extent in following rows into rectangles"""
+    if not len(locations):
+        return zeros((0, 3), dtype= float32), zeros((0, 4), dtype= int32)
+    playground, mins = create_playground(locations)
+    corners = []
+    for axis in range(3):
+        axes = (axis, (axis + 1) % 3, (axis + 2) % 3)
+        grid = playground.transpose(axes)
+        for exposed, forward in ((grid[:-1] & ~grid[1:], True), (grid[1:] & ~grid[:-1], False)):
+            edges = diff(exposed.astype(int8), axis= -1, prepend= 0, append= 0)
+            plane, row, start = nonzero(edges == 1)
+            stop = nonzero(edges == -1)[2]
+            order = lexsort((row, stop, start, plane))
+            plane, row, start, stop = plane[order], row[order], start[order], stop[order]
+            begins = ones(len(row), dtype= bool)
+            begins[1: ] = (plane[1: ] != plane[:-1]) | (start[1: ] != start[:-1]) | (stop[1: ] != stop[:-1]) | (row[1: ] != row[:-1] + 1)
+            first = nonzero(begins)[0]
+            last = concatenate((first[1: ] - 1, [len(row) - 1]))
+            # corners on the lattice between the cells, both directions face the plane between the cells plane and plane + 1
+            d = plane[first] + 1
+            u0, u1 = row[first], row[last] + 1
+            v0, v1 = start[first], stop[first]
+            quad = [(u0, v0), (u1, v0), (u1, v1), (u0, v1)] if forward else [(u0, v0), (u0, v1), (u1, v1), (u1, v0)]
+            rectangles = empty((len(d), 4, 3), dtype= int64)
+            for corner, (u, v) in enumerate(quad):
+                rectangles[:, corner, axes[0]] = d
+                rectangles[:, corner, axes[1]] = u
+                rectangles[:, corner, axes[2]] = v
+            corners.append(rectangles.reshape(-1, 3))
+    corners = concatenate(corners)
+    # shared corners through unique keys, sorting rows of coordinates is far slower
+    keys, faces = unique((corners[:, 0] << (2 * key_bits)) | (corners[:, 1] << key_bits) | corners[:, 2], return_inverse= True)
+    mask = (1 << key_bits) - 1
+    vertices = array([keys >> (2 * key_bits), (keys >> key_bits) & mask, keys & mask]).T
+    return (vertices + mins - 0.5).astype(float32), faces.astype(int32).reshape(-1, 4)
+
+def dense_step(locations: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool) -> Tuple[List[Tuple], int]:
+    """next generation of the locations on one dense playground and the number of cells of the playground"""
+    if not len(locations):
+        return [], 0
+    playground, mins = create_playground(locations)
+    alives = argwhere(next_state(playground, low_value, high_value, use_3d, use_diagnol, combine_planes)) + mins + 1
+    return list(map(tuple, alives.tolist())), playground.size
+
+def apply_rules(locations: List[Tuple], low_value: int, high_value: int ,use_3d : bool, use_diagnol : bool, combine_planes: bool) -> List[tuple]:
+    return dense_step(locations, low_value, high_value, use_3d, use_diagnol, combine_planes)[0]
+
+class DenseWorld:
+    """steps the game like apply_rules on one dense playground per generation"""
+    allocated = 0
+
+    def __init__(self, locations: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool):
+        self.rules = (low_value, high_value, use_3d, use_diagnol, combine_planes)
+        self.locations = list(locations)
+
+    def step(self) -> List[Tuple]:
+        self.locations, self.allocated = dense_step(self.locations, *self.rules)
+        return self.locations
+
+chunk_size = 16
+chunk_neighbors = [(i, j, k) for i in (-1, 0, 1) for j in (-1, 0, 1) for k in (-1, 0, 1)]
+
+class SparseWorld:
+    """steps the game only inside fixed-size chunks that hold alive cells and only where something changed"""
+    allocated = 0
+
+    def __init__(self, locations: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool):
+        self.rules = (low_value, high_value, use_3d, use_diagnol, combine_planes)
+        # 2D games only interact inside their own layer, so a chunk is a single layer thick
+        self.shape = (chunk_size, chunk_size, chunk_size if use_3d else 1)
+        self.chunks = {}
+        self.changed = set()
+        self.locations = list(locations)
+        if not len(locations):
+            return
+        cells = array(locations, dtype= int64).reshape(-1, 3)
+        keys = cells // self.shape
+        cells = cells - keys * self.shape
+        for key in set(map(tuple, keys.tolist())):
+            self.chunks[key] = zeros(self.shape, dtype= bool)
+        for key, cell in zip(map(tuple, keys.tolist()), map(tuple, cells.tolist())):
+            self.chunks[key][cell] = True
+        self.changed = set(self.chunks)
+
+    def padded_chunk(self, key: Tuple, out: ndarray) -> None:
+        x, y, z = key
+        for i, j, k in chunk_neighbors:
+            chunk = self.chunks.get((x + i, y + j, z + k), None)
+            if chunk is None:
+                continue
+            source = tuple(slice(-1, None) if l == -1 else slice(None, 1) if l == 1 else slice(None) for l in (i, j, k))
+            target = tuple(slice(None, 1) if l == -1 else slice(-1, None) if l == 1 else slice(1, -1) for l in (i, j, k))
+            out[target] = chunk[source]
+
+    def step(self) -> List[Tuple]:
+        # a chunk can only change if itself or one of its neighbors changed in the last generation
+        candidates = list(set((x + i, y + j, z + k) for x, y, z in self.changed for i, j, k in chunk_neighbors))
+        padded = zeros((len(candidates), *(i + 2 for i in self.shape)), dtype= bool)
+        for key, out in zip(candidates, padded):
+            self.padded_chunk(key, out)
+        self.allocated = padded.size
+        states = next_state(padded, *self.rules)
+        self.changed = set()
+        for key, state, out in zip(candidates, states, padded):
+            if not (state ^ out[1:-1, 1:-1, 1:-1]).any():
+                continue
+            self.changed.add(key)
+            if state.any():
+                self.chunks[key] = state
+            else:
+                self.chunks.pop(key, None)
+        if self.changed:
+            self.locations = self.get_locations()
+        return self.locations
+
+    def get_locations(self) -> List[Tuple]:
+        locations = []
+        for key, chunk in self.chunks.items():
+            locations += map(tuple, (argwhere(chunk) + array(key) * self.shape).tolist())
+        return locations
+
+class BitboardWorld:
+    """steps 2D games on rows of bits, 64 cells along x packed into every uint64 word
+
+    the neighbor counts of all cells are summed at once with bitwise adders, 3D games are stepped by DenseWorld"""
+    allocated = 0
+    row_padding = 32
+
+    def __init__(self, locations: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool):
+        self.dense = DenseWorld(locations, low_value, high_value, use_3d, use_diagnol, combine_planes) if use_3d else None
+        self.survive = [count for count in range(9) if low_value <= count <= high_value]
+        self.born = high_value if 0 <= high_value <= 8 else None
+        # only cells next to an alive cell can change, a birth without neighbors can only come from the layers above and below
+        self.layer_padding = 1 if high_value == 0 else 0
+        cells = array(locations, dtype= int64).reshape(-1, 3)
+        self.origin = cells.min(axis= 0) if len(cells) else zeros(3, dtype= int64)
+        self.board = zeros((0, 0, 0), dtype= uint64)
+        if len(cells):
+            cells -= self.origin
+            self.board = zeros((cells[:, 2].max() + 1, cells[:, 1].max() + 1, cells[:, 0].max() // 64 + 1), dtype= uint64)
+            bitwise_or.at(self.board, (cells[:, 2], cells[:, 1], cells[:, 0] // 64), uint64(1) << (cells[:, 0] % 64).astype(uint64))
+        self.fit(force= True)
+
+    def fit(self, force: bool = False) -> None:
+        """keeps an empty border around the alive cells, so nothing can grow out of the board"""
+        board = self.board
+        layers, rows, words = (nonzero(board.any(axis= axes))[0] for axes in ((1, 2), (0, 2), (0, 1)))
+        if not len(layers):
+            self.board = zeros((0, 0, 0), dtype= uint64)
+            return
+        if not force and layers[0] >= self.layer_padding and layers[-1] < len(board) - self.layer_padding and rows[0] >= 1 and rows[-1] < board.shape[1] - 1 and words[0] >= 1 and words[-1] < board.shape[2] - 1:
+            return
+        padding = (self.layer_padding, self.row_padding, 1)
+        fitted = zeros((layers[-1] - layers[0] + 1 + 2 * padding[0], rows[-1] - rows[0] + 1 + 2 * padding[1], words[-1] - words[0] + 1 + 2 * padding[2]), dtype= uint64)
+        fitted[padding[0]: fitted.shape[0] - padding[0], padding[1]: fitted.shape[1] - padding[1], padding[2]: fitted.shape[2] - padding[2]] = board[layers[0]: layers[-1] + 1, rows[0]: rows[-1] + 1, words[0]: words[-1] + 1]
+        self.origin = self.origin + array(((words[0] - padding[2]) * 64, rows[0] - padding[1], layers[0] - padding[0]))
+        self.board = fitted
+
+    @staticmethod
+    def shift(board: ndarray, axis: int, offset: int) -> ndarray:
+        """board[i] holds the former board[i - offset] along axis, emptied at the edge"""
+        shifted = zeros(board.shape, dtype= uint64)
+        source = [slice(None)] * 3
+        target = [slice(None)] * 3
+        source[axis] = slice(None, -offset) if offset > 0 else slice(-offset, None)
+        target[axis] = slice(offset, None) if offset > 0 else slice(None, offset)
+        shifted[tuple(target)] = board[tuple(source)]
+        return shifted
+
+    @classmethod
+    def west(cls, board: ndarray) -> ndarray:
+        """every cell holds the cell at x - 1"""
+        return (board << uint64(1)) | (cls.shift(board, 2, 1) >> uint64(63))
+
+    @classmethod
+    def east(cls, board: ndarray) -> ndarray:
+        """every cell holds the cell at x + 1"""
+        return (board >> uint64(1)) | (cls.shift(board, 2, -1) << uint64(63))
+
+    @staticmethod
+    def add(*bits: ndarray) -> Tuple[ndarray, ndarray]:
+        """sum and carry of a half or full adder"""
+        if len(bits) == 2:
+            a, b = bits
+            return a ^ b, a & b
+        a, b, c = bits
+        half = a ^ b
+        return half ^ c, (a & b) | (c & half)
+
+    def count_bits(self, board: ndarray) -> List[ndarray]:
+        """the four bits of the neighbor count of every cell"""
+        west, east = self.west(board), self.east(board)
+        rows = (west, board, east)
+        neighbors = [self.shift(row, 1, offset) for offset in (-1, 1) for row in rows] + [west, east]
+        sum_a, carry_a = self.add(*neighbors[0: 3])
+        sum_b, carry_b = self.add(*neighbors[3: 6])
+        sum_c, carry_c = self.add(*neighbors[6: 8])
+        bit_1, carry_1 = self.add(sum_a, sum_b, sum_c)
+        sum_2, carry_2 = self.add(carry_a, carry_b, carry_c)
+        bit_2, carry_3 = self.add(sum_2, carry_1)
+        bit_4, bit_8 = self.add(carry_2, carry_3)
+        return [bit_1, bit_2, bit_4, bit_8]
+
+    @staticmethod
+    def equals(bits: List[ndarray], count: int) -> ndarray:
+        mask = ~zeros(bits[0].shape, dtype= uint64)
+        for i, bit in enumerate(bits):
+            mask &= bit if count >> i & 1 else ~bit
+        return mask
+
+    def step(self) -> ndarray:
+        if self.dense is not None:
+            return self.dense.step()
+        board = self.board
+        self.allocated = board.size * 64
+        if board.size:
+            bits = self.count_bits(board)
+            survive = zeros(board.shape, dtype= uint64)
+            for count in self.survive:
+                survive |= self.equals(bits, count)
+            board_next = board & survive
+            if self.born is not None:
+                born = self.equals(bits, self.born)
+                if self.born == 0:
+                    near = self.west(board) | board | self.east(board)
+                    near = self.shift(near, 1, -1) | near | self.shift(near, 1, 1)
+                    born &= self.shift(near, 0, -1) | near | self.shift(near, 0, 1)
+                board_next |= ~board & born
+            self.board = board_next
+            self.fit()
+        return self.get_locations()
+
+    def get_locations(self) -> ndarray:
+        """(n, 3) int32 cells, only the words holding alive cells are unpacked"""
+        layers, rows, words = nonzero(self.board)
+        bits = unpackbits(self.board[layers, rows, words].astype('<u8').view(uint8).reshape(-1, 8), axis= 1, bitorder= 'little')
+        index, bit = nonzero(bits)
+        cells = empty((len(index), 3), dtype= int64)
+        cells[:, 0] = words[index] * 64 + bit
+        cells[:, 1] = rows[index]
+        cells[:, 2] = layers[index]
+        return (cells + self.origin).astype(int32)
+
+class HashNode:
+    """canonical quadtree/octree node, equal sub-patterns are always the same node"""
+    __slots__ = ('level', 'children', 'population', 'next', 'cells')
+
+    def __init__(self, children: tuple):
+        self.children = children
+        if isinstance(children[0], bool):
+            self.level = 1
+            self.population = sum(children)
+        else:
+            self.level = children[0].level + 1
+            self.population = sum(child.population for child in children)
+        self.next = None
+        self.cells = None
+
+class HashlifeWorld:
+    """steps the game on a hash-consed quadtree (2D) or octree (3D) and memoizes the next generation of every node"""
+    cache_limit = 500000
+    allocated = 0
+
+    def __init__(self, locations: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool):
+        self.rules = (low_value, high_value, use_3d, use_diagnol, combine_planes)
+        layers = set(location[2] for location in locations)
+        # with a high value of 0 cells are also born in the neighboring layers, so only a single layer game without it stays plane
+        self.dimensions = 2 if not use_3d and len(layers) <= 1 and high_value != 0 else 3
+        self.layer = next(iter(layers), 0)
+        self.corners = list(product((0, 1), repeat= self.dimensions))
+        self.index = {corner: i for i, corner in enumerate(self.corners)}
+        self.opposite = [self.index[tuple(1 - x for x in corner)] for corner in self.corners]
+        # (child, grandchild) indices of the grandchildren at every position, so the recursion only looks them up
+        grandchildren = lambda position: (self.index[tuple(x >> 1 for x in position)], self.index[tuple(x & 1 for x in position)])
+        offsets = list(product(range(3), repeat= self.dimensions))
+        self.quarters = [tuple(grandchildren(tuple(x + y for x, y in zip(offset, corner))) for corner in self.corners) for offset in offsets]
+        self.combinations = [tuple(offsets.index(tuple(x + y for x, y in zip(position, corner))) for corner in self.corners) for position in self.corners]
+        self.leaves = [grandchildren(position) for position in product(range(4), repeat= self.dimensions)]
+        self.base_cases = {} # next center of every 4 cells wide pattern, kept when the nodes are built again
+        self.locations = list(locations)
+        self.build(self.locations)
+
+    def build(self, locations: List[Tuple]) -> None:
+        self.nodes = {}
+        self.empty_nodes = [False]
+        cells = array(locations, dtype= int64).reshape(-1, 3)[:, :self.dimensions]
+        self.origin = cells.min(axis= 0) if len(cells) else zeros(self.dimensions, dtype= int64)
+        size = int((cells - self.origin).max()) + 1 if len(cells) else 1
+        level = 0
+        current = {tuple(cell): True for cell in (cells - self.origin).tolist()}
+        while level < 3 or (1 << level) < size:
+            parents = {}
+            for position, node in current.items():
+                children = parents.setdefault(tuple(x >> 1 for x in position), [self.empty(level)] * len(self.corners))
+                children[self.index[tuple(x & 1 for x in position)]] = node
+            current = {position: self.join(tuple(children)) for position, children in parents.items()}
+            level += 1
+        self.root = current.get((0, ) * self.dimensions, self.empty(level))
+
+    def join(self, children: tuple) -> HashNode:
+        node = self.nodes.get(children, None)
+        if node is None:
+            node = HashNode(children)
+            self.nodes[children] = node
+        return node
+
+    def empty(self, level: int) -> HashNode:
+        while len(self.empty_nodes) <= level:
+            self.empty_nodes.append(self.join((self.empty_nodes[-1], ) * len(self.corners)))
+        return self.empty_nodes[level]
+
+    def center(self, node: HashNode) -> HashNode:
+        return self.join(tuple(child.children[opposite] for child, opposite in zip(node.children, self.opposite)))
+
+    def expand(self, node: HashNode) -> HashNode:
+        empty = self.empty(node.level - 1)
+        return self.join(tuple(
+            self.join(tuple(child if i == opposite else empty for i in range(len(self.corners))))
+            for child, opposite in zip(node.children, self.opposite)
+        ))
+
+    def base_case(self, node: HashNode) -> HashNode:
+        pattern = tuple(node.children[child].children[grandchild] for child, grandchild in self.leaves)
+        result = self.base_cases.get(pattern, None)
+        if result is None:
+            padded = zeros((4, 4, 4 if self.dimensions == 3 else 3), dtype= bool)
+            grid = padded if self.dimensions == 3 else padded[:, :, 1]
+            grid[...] = array(pattern, dtype= bool).reshape((4, ) * self.dimensions)
+            state = next_state(padded, *self.rules)
+            result = tuple(bool(state[corner + (0, ) * (3 - self.dimensions)]) for corner in self.corners)
+            if len(self.base_cases) > self.cache_limit:
+                self.base_cases.clear()
+            self.base_cases[pattern] = result
+        return self.join(result)
+
+    def successor(self, node: HashNode) -> HashNode:
+        """center of node one generation later"""
+        if node.next is not None:
+            return node.next
+        if node.population == 0:
+            result = self.empty(node.level - 1)
+        elif node.level == 2:
+            result = self.base_case(node)
+        else:
+            children = node.children
+            steps = [
+                self.successor(self.join(tuple(children[child].children[grandchild] for child, grandchild in quarter)))
+                for quarter in self.quarters
+            ]
+            result = self.join(tuple(self.center(self.join(tuple(steps[i] for i in combination))) for combination in self.combinations))
+        node.next = result
+        return result
+
+    def node_cells(self, node: HashNode) -> ndarray:
+        if node.cells is not None:
+            return node.cells
+        if node.level == 1:
+            parts = [array([corner], dtype= int64) for corner, alive in zip(self.corners, node.children) if alive]
+        else:
+            half = 1 << (node.level - 1)
+            parts = [self.node_cells(child) + array(corner, dtype= int64) * half for corner, child in zip(self.corners, node.children) if child.population]
+        cells = concatenate(parts) if parts else zeros((0, self.dimensions), dtype= int64)
+        if node.level <= 6:
+            node.cells = cells
+        return cells
+
+    def step(self) -> List[Tuple]:
+        if self.root.population == 0:
+            self.locations = []
+            return self.locations
+        # the next generation has to fit into the center of the root
+        while self.root.level < 3 or self.center(self.center(self.root)).population != self.root.population:
+            self.origin -= 1 << (self.root.level - 1)
+            self.root = self.expand(self.root)
+        self.origin += 1 << (self.root.level - 2)
+        self.root = self.successor(self.root)
+        cells = self.node_cells(self.root) + self.origin
+        if self.dimensions == 2:
+            cells = concatenate((cells, full((len(cells), 1), self.layer, dtype= int64)), axis= 1)
+        self.locations = list(map(tuple, cells.tolist()))
+        if len(self.nodes) > self.cache_limit:
+            self.build(self.locations)
+        return self.locations
+
+engines = {
+    'DENSE' : DenseWorld,
+    'SPARSE' : SparseWorld,
+    'HASHLIFE' : HashlifeWorld,
+    'BITBOARD' : BitboardWorld
+}
+engine_items = [
+    ('DENSE', "Dense", "Simulate on one playground covering all alive cells"),
+    ('SPARSE', "Sparse", "Simulate only chunks with alive cells that changed, for widely separated patterns"),
+    ('HASHLIFE', "Hashlife", "Simulate on memoized quadtrees, for long 2D runs with repeating patterns (chaotic 3D games are faster with Dense)"),
+    ('BITBOARD', "Bitboard", "Simulate 2D games on bit-packed rows, for large boards (3D games use Dense)")
+]
+
+def generation_hash(locations: List[Tuple]) -> bytes:
+    """canonical hash of the alive cells, independent of their order"""
+    cells = array(locations, dtype= int64).reshape(-1, 3)
+    cells = cells[lexsort(cells.T[::-1])]
+    return blake2b(cells.tobytes(), digest_size= 16).digest()
+
+class Profile:
+    """wall time and calls of every phase, in total and per generation"""
+    disabled = nullcontext()
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self.phases = {}
+        self.generations = {}
+
+    def measure(self, phase: str, generation: int):
+        """context to time phase, does nothing if the profile is disabled"""
+        if not self.enabled:
+            return self.disabled
+        return self.timer(phase, generation)
+
+    @contextmanager
+    def timer(self, phase: str, generation: int) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, generation, perf_counter() - start)
+
+    def add(self, phase: str, generation: int, seconds: float) -> None:
+        total = self.phases.setdefault(phase, [0.0, 0])
+        total[0] += seconds
+        total[1] += 1
+        record = self.generations.setdefault(generation, {})
+        record[phase] = record.get(phase, 0.0) + seconds
+
+    def record(self, generation: int, **values) -> None:
+        if self.enabled:
+            self.generations.setdefault(generation, {}).update(values)
+
+    def summary(self) -> List[Tuple[str, float, int]]:
+        """(phase, seconds, calls) with the slowest phase first"""
+        return sorted(((phase, seconds, calls) for phase, (seconds, calls) in self.phases.items()), key= lambda x: -x[1])
+
+    def save(self, path: str) -> None:
+        """saves the profile as JSON or, if path ends with .csv, one row per generation as CSV"""
+        generations = [dict(generation= generation, **record) for generation, record in sorted(self.generations.items())]
+        with open(path, 'w', newline= '') as file:
+            if path.lower().endswith('.csv'):
+                columns = ['generation', 'cells', 'allocated'] + sorted(self.phases)
+                writer = csv.DictWriter(file, columns)
+                writer.writeheader()
+                writer.writerows(generations)
+            else:
+                phases = {phase: {'seconds': seconds, 'calls': calls} for phase, seconds, calls in self.summary()}
+                json.dump({'phases': phases, 'generations': generations}, file, indent= 2)
+
+def simulate(locations: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool, engine: str, generations: int, cache_limit: int, profile: bool = False, seen: Dict[bytes, int] = None, first: int = 0) -> Iterator[tuple]:
+    """yields ('generation', cells, stats) for every new generation and ('cycle', start, period) once a generation repeats
+
+    stats holds the seconds of the simulation and the allocated playground cells if profile is set, otherwise it is None.
+    seen and first continue a run, seen maps the hashes of the generations before locations to their frame and first is the frame of locations"""
+    world = engines[engine](locations, low_value, high_value, use_3d, use_diagnol, combine_planes)
+    if engine == 'HASHLIFE':
+        world.cache_limit = cache_limit
+    seen = dict(seen or {})
+    seen[generation_hash(locations)] = first
+    stats = None
+    for frame in range(first + 1, first + generations + 1):
+        start = perf_counter()
+        locations = world.step()
+        if profile:
+            stats = {'simulation': perf_counter() - start, 'allocated': world.allocated}
+        generation = generation_hash(locations)
+        if generation in seen: # all following generations repeat already simulated ones
+            yield ('cycle', seen[generation], frame - seen[generation])
+            return
+        seen[generation] = frame
+        yield ('generation', array(locations, dtype= int32).reshape(-1, 3), stats)
+
+def simulation_worker(queue, stop, simulated, *args) -> None:
+    """runs simulate in a worker process and streams its results through queue"""
+    try:
+        for message in simulate(*args):
+            if stop.is_set():
+                return
+            queue.put(message)
+            with simulated.get_lock():
+                simulated.value += 1
+        queue.put(('done', ))
+    except Exception:
+        queue.put(('error', format_exc()))
+
+def random_soup(size: int, density: float, use_3d: bool, seed: int) -> ndarray:
+    """(n, 3) int32 cells of a size wide square or cube, every cell alive with probability density"""
+    shape = (size, size, size if use_3d else 1)
+    return argwhere(default_rng(seed).random(shape) < density).astype(int32)
+
+def sweep_variants(low_values: List[int], high_values: List[int], diagonals: List[bool], combines: List[bool], densities: List[float]) -> List[dict]:
+    """every combination of the rule values and seed densities, a density of 0 keeps the given seed"""
+    return [
+        dict(value_low= low, value_high= high, use_diagonal= diagonal, combine_planes= combine, density= density)
+        for low, high, diagonal, combine, density in product(low_values, high_values, diagonals, combines, densities or [0])
+    ]
+
+def sweep_seed(variant: dict, locations: ndarray, size: int, use_3d: bool, seed: int) -> ndarray:
+    if variant['density'] > 0:
+        return random_soup(size, variant['density'], use_3d, seed)
+    return array(locations, dtype= int32).reshape(-1, 3)
+
+def bounding_extent(cells: ndarray) -> int:
+    """longest side of the bounding box of the cells, 0 if there are none"""
+    if not len(cells):
+        return 0
+    return int((cells.max(axis= 0) - cells.min(axis= 0)).max()) + 1
+
+def run_variant(variant: dict, locations: ndarray, size: int, use_3d: bool, seed: int, generations: int, engine: str) -> dict:
+    """simulates a sweep variant and returns it with the population and bounding box extent of every generation,
+    the generation it died out (-1 if it didn't) and its cycle"""
+    cells = sweep_seed(variant, locations, size, use_3d, seed)
+    population = [len(cells)]
+    extent = [bounding_extent(cells)]
+    cycle_start = -1
+    period = 0
+    rules = (variant['value_low'], variant['value_high'], use_3d, variant['use_diagonal'], variant['combine_planes'])
+    for message in simulate(cells, *rules, engine, generations, HashlifeWorld.cache_limit):
+        if message[0] == 'cycle':
+            cycle_start, period = message[1:]
+            break
+        population.append(len(message[1]))
+        extent.append(bounding_extent(message[1]))
+    # a died out game repeats the empty generation, so it ends with a cycle of period 1
+    extinct = population.index(0) if 0 in population else -1
+    return dict(
+        variant, population= population, extent= extent, extinct= extinct, cycle_start= cycle_start, period= period,
+        lifetime= cycle_start if period else len(population) - 1, growth= extent[-1] / max(extent[0], 1)
+    )
+
+sweep_rankings = {
+    'LIFETIME' : lambda result: (result['lifetime'], result['population'][-1]),
+    'POPULATION' : lambda result: (result['population'][-1], result['lifetime']),
+    'GROWTH' : lambda result: (result['growth'], result['lifetime'])
+}
+sweep_ranking_items = [
+    ('LIFETIME', "Lifetime", "Generations before the game dies out or repeats"),
+    ('POPULATION', "Population", "Alive cells in the last generation"),
+    ('GROWTH', "Growth", "Growth of the bounding box from the seed to the last generation")
+]
+
+def rank_variants(results: List[dict], ranking: str) -> List[dict]:
+    return sorted(results, key= sweep_rankings[ranking], reverse= True)
+
+key_bits = 21
+key_offset = 1 << (key_bits - 1)
+
+def encode_cells(cells: ndarray) -> ndarray:
+    """sorted int64 keys of the cells or None if a coordinate doesn't fit into key_bits"""
+    if len(cells) and (cells.min() < -key_offset or cells.max() >= key_offset):
+        return None
+    shifted = cells.astype(int64) + key_offset
+    keys = (shifted[:, 0] << (2 * key_bits)) | (shifted[:, 1] << key_bits) | shifted[:, 2]
+    keys.sort()
+    return keys
+
+def decode_cells(keys: ndarray) -> ndarray:
+    mask = (1 << key_bits) - 1
+    cells = empty((len(keys), 3), dtype= int32)
+    cells[:, 0] = (keys >> (2 * key_bits)) - key_offset
+    cells[:, 1] = ((keys >> key_bits) & mask) - key_offset
+    cells[:, 2] = (keys & mask) - key_offset
+    return cells
+
+def cell_difference(a: ndarray, b: ndarray) -> ndarray:
+    """cells alive in only one of a and b"""
+    keys_a, keys_b = encode_cells(a), encode_cells(b)
+    if keys_a is None or keys_b is None:
+        raise ValueError("cells are out of range of the cell keys")
+    return decode_cells(setxor1d(keys_a, keys_b, assume_unique= True))
+
+def inside(cells: ndarray, low: ndarray, high: ndarray) -> ndarray:
+    return ((cells >= low) & (cells <= high)).all(axis= 1)
+
+def step_region(cells: ndarray, low: ndarray, high: ndarray, rules: tuple) -> ndarray:
+    """next state of the cells from low to high, only needs the cells one further out"""
+    playground = zeros(tuple(high - low + 3), dtype= bool)
+    cells = cells[inside(cells, low - 1, high + 1)]
+    playground[tuple((cells - low + 1).T)] = True
+    return (argwhere(next_state(playground, *rules)) + low).astype(int32)
+
+def rebake(generations, seed: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool) -> Iterator[Tuple[ndarray, bool]]:
+    """yields every generation of the run from seed and whether it differs from the one in generations
+
+    a cell can only differ if one next to it differed in the last generation, so only the bounding box of the
+    differences grown by one cell is simulated and the run follows generations again once they agree"""
+    rules = (low_value, high_value, use_3d, use_diagnol, combine_planes)
+    cells = array(seed, dtype= int32).reshape(-1, 3)
+    difference = cell_difference(cells, array(generations[0], dtype= int32).reshape(-1, 3))
+    yield cells, bool(len(difference))
+    for index in range(1, len(generations)):
+        previous = array(generations[index], dtype= int32).reshape(-1, 3)
+        if not len(difference):
+            yield previous, False
+            continue
+        low = difference.min(axis= 0).astype(int64) - 1
+        high = difference.max(axis= 0).astype(int64) + 1
+        region = step_region(cells, low, high, rules)
+        is_inside = inside(previous, low, high)
+        difference = cell_difference(region, previous[is_inside])
+        cells = concatenate((previous[~is_inside], region))
+        yield cells, bool(len(difference))
+
+class GenerationHistory:
+    """all generations as packed int32 cells, every keyframe_interval-th generation completely and the ones in between as births and deaths"""
+    keyframe_interval = 32
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self) -> None:
+        self.frames = [] # (cells, ) for keyframes, (births, deaths) otherwise
+        self.last = None
+        self.cache = (-1, None)
+        self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+    def append(self, locations) -> None:
+        cells = array(locations, dtype= int32).reshape(-1, 3)
+        keys = encode_cells(cells)
+        if keys is None or self.last is None or len(self.frames) % self.keyframe_interval == 0:
+            self.frames.append((cells, ))
+        else:
+            births = setdiff1d(keys, self.last, assume_unique= True)
+            deaths = setdiff1d(self.last, keys, assume_unique= True)
+            self.frames.append((decode_cells(births), decode_cells(deaths)))
+        self.nbytes += sum(cells.nbytes for cells in self.frames[-1])
+        self.last = keys
+
+    def __getitem__(self, index: int) -> ndarray:
+        if index < 0:
+            index += len(self.frames)
+        if not 0 <= index < len(self.frames):
+            raise IndexError("generation out of range")
+        if len(self.frames[index]) == 1:
+            return self.frames[index][0]
+        start = index
+        while len(self.frames[start]) != 1:
+            start -= 1
+        # continue from the last decoded generation when reading in order
+        cached, keys = self.cache
+        if not start <= cached < index:
+            cached, keys = start, encode_cells(self.frames[start][0])
+        for births, deaths in self.frames[cached + 1: index + 1]:
+            keys = union1d(setdiff1d(keys, encode_cells(deaths), assume_unique= True), encode_cells(births))
+        self.cache = (index, keys)
+        return decode_cells(keys)
+
+class FrameStore:
+    """generations in a file with a header, one packed int32 block per generation and an offset index, read through numpy.memmap"""
+    magic = b'BGOLFRM1'
+    header = Struct('<8sQQQ') # magic, generations, index offset, settings offset
+
+    def __init__(self, path: str):
+        """opens the frame store at path for reading"""
+        self.path = path
+        self.file = None
+        self.open()
+
+    @classmethod
+    def create(cls, path: str) -> 'FrameStore':
+        """creates a new frame store to append generations to, it is written next to path and only replaces it once finished"""
+        store = cls.__new__(cls)
+        store.path = path
+        store.file = open(path + '.partial', 'w+b')
+        store.file.write(cls.header.pack(cls.magic, 0, 0, 0))
+        store.offsets = []
+        store.nbytes = cls.header.size
+        store.settings = {}
+        store.memmap = store.index = None
+        return store
+
+    def open(self) -> None:
+        with open(self.path, 'rb') as file:
+            magic, generations, index_offset, settings_offset = self.header.unpack(file.read(self.header.size))
+            if magic != self.magic:
+                raise ValueError("%s is not a frame store" %self.path)
+            if settings_offset == 0:
+                raise ValueError("%s was not finished" %self.path)
+            file.seek(settings_offset)
+            self.settings = json.loads(file.read().decode())
+        self.memmap = memmap(self.path, dtype= int32, mode= 'r', shape= (index_offset // 4, ))
+        self.index = memmap(self.path, dtype= int64, mode= 'r', offset= index_offset, shape= (generations, 2)) if generations else zeros((0, 2), dtype= int64)
+        self.nbytes = settings_offset
+
+    def append(self, locations) -> None:
+        cells = array(locations, dtype= int32).reshape(-1, 3)
+        self.offsets.append((self.file.tell(), len(cells)))
+        self.file.write(cells.tobytes())
+        self.nbytes += cells.nbytes
+
+    def finish(self, **settings) -> None:
+        """writes the offset index and settings and opens the store for reading"""
+        self.file.write(bytes(-self.file.tell() % 8))
+        index_offset = self.file.tell()
+        self.file.write(array(self.offsets, dtype= int64).reshape(-1, 2).tobytes())
+        settings_offset = self.file.tell()
+        self.file.write(json.dumps(settings).encode())
+        self.file.seek(0)
+        self.file.write(self.header.pack(self.magic, len(self.offsets), index_offset, settings_offset))
+        self.file.close()
+        self.file = None
+        os.replace(self.path + '.partial', self.path)
+        self.open()
+
+    def close(self) -> None:
+        """closes the store, an unfinished one is removed"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+            with suppress(OSError):
+                os.remove(self.path + '.partial')
+        self.memmap = self.index = None
+
+    def subrange(self, start: int, stop: int) -> 'FrameStore':
+        """store of the generations from start to stop, sharing the memory map"""
+        store = copy(self)
+        store.index = self.index[start: stop]
+        return store
+
+    def __len__(self) -> int:
+        return len(self.offsets) if self.file is not None else len(self.index)
+
+    def __getitem__(self, index: int) -> ndarray:
+        offset, count = self.index[index]
+        start = int(offset) // 4
+        return self.memmap[start: start + 3 * int(count)].reshape(-1, 3)
+
+class BakeCache:
+    """finished runs as frame stores in directory, named by the hash of their seed and rules
+
+    the least recently used runs are removed once the stores take more than size_limit bytes"""
+    def __init__(self, directory: str, size_limit: int):
+        self.directory = directory
+        self.size_limit = size_limit
+
+    @staticmethod
+    def key(locations: List[Tuple], low_value: int, high_value: int, use_3d : bool, use_diagnol : bool, combine_planes: bool) -> str:
+        """the frame range isn't part of the key, a longer run serves every shorter one"""
+        rules = json.dumps([low_value, high_value, use_3d, use_diagnol, combine_planes]).encode()
+        return blake2b(generation_hash(locations) + rules, digest_size= 16).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.frames')
+
+    def get(self, key: str) -> Optional[FrameStore]:
+        path = self.path(key)
+        try:
+            store = FrameStore(path)
+        except (OSError, ValueError, struct_error):
+            return None
+        os.utime(path) # marks the run as recently used
+        return store
+
+    def put(self, key: str, generations, length: Optional[int] = None, **settings) -> None:
+        """stores the first length generations, all if length is None, they must not repeat each other"""
+        os.makedirs(self.directory, exist_ok= True)
+        path = self.path(key)
+        store = FrameStore.create(path)
+        for index in range(len(generations) if length is None else length):
+            store.append(generations[index])
+        store.finish(**settings)
+        store.close()
+        self.evict()
+
+    def evict(self) -> None:
+        entries = sorted((entry.stat().st_mtime, entry.stat().st_size, entry.path) for entry in os.scandir(self.directory) if entry.name.endswith('.frames'))
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= self.size_limit:
+                break
+            with suppress(OSError):
+                os.remove(path)
+                size -= entry_size
+
+    def clear(self) -> None:
+        if not os.path.isdir(self.directory):
+            return
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(('.frames', '.partial')):
+                with suppress(OSError):
+                    os.remove(entry.path)
+
+def read_seed(path: str) -> List[Tuple]:
+    """reads one 'x y' or 'x y z' location of an alive cell per line, '#' starts a comment"""
+    locations = []
+    with open(path) as file:
+        for line in file:
+            values = line.split('#', 1)[0].replace(',', ' ').split()
+            if not values:
+                continue
+            location = tuple(int(value) for value in values)
+            if len(location) == 2:
+                location += (0, )
+            if len(location) != 3:
+                raise ValueError("%s: expected 2 or 3 coordinates, got '%s'" %(path, line.strip()))
+            locations.append(location)
+    return locations
+
+def cells_array(xs: array_buffer, ys: array_buffer) -> ndarray:
+    """(n, 3) cells in the z = 0 plane, the rows of the pattern go down the y axis"""
+    cells = zeros((len(xs), 3), dtype= int32)
+    cells[:, 0] = frombuffer(xs, dtype= int32) if len(xs) else 0
+    cells[:, 1] = -frombuffer(ys, dtype= int32) if len(ys) else 0
+    return cells
+
+def read_rle(path: str) -> ndarray:
+    """alive cells of a Golly RLE pattern, every state but the dead one is alive and the rule line is ignored"""
+    xs, ys = array_buffer('i'), array_buffer('i')
+    x = y = 0
+    count = ''
+    with open(path) as file:
+        for line in file: # streamed, runs are appended to compact buffers
+            if line.startswith('#') or line.lstrip().startswith('x'):
+                continue
+            for char in line:
+                if char.isdigit():
+                    count += char
+                    continue
+                if char.isspace():
+                    continue
+                run = int(count) if count else 1
+                count = ''
+                if char in 'b.':
+                    x += run
+                elif char == '$':
+                    x = 0
+                    y += run
+                elif char == '!':
+                    return cells_array(xs, ys)
+                else:
+                    xs.extend(range(x, x + run))
+                    ys.extend([y] * run)
+                    x += run
+    return cells_array(xs, ys)
+
+def read_plaintext(path: str) -> ndarray:
+    """alive cells of a .cells plaintext pattern, 'O' or '*' is alive and '!' starts a comment line"""
+    xs, ys = array_buffer('i'), array_buffer('i')
+    with open(path) as file:
+        y = 0
+        for line in file:
+            if line.startswith('!'):
+                continue
+            for x, char in enumerate(line):
+                if char in 'O*':
+                    xs.append(x)
+                    ys.append(y)
+            y += 1
+    return cells_array(xs, ys)
+
+def read_occupancy(path: str, chunk_size: int = 256) -> ndarray:
+    """alive cells of a 2D or 3D .npy occupancy array, its indices are the x, y (and z) location of the cell
+
+    the array is memory mapped and converted in chunks along its first axis"""
+    occupancy = load(path, mmap_mode= 'r')
+    if occupancy.ndim not in (2, 3):
+        raise ValueError("%s: expected a 2D or 3D occupancy array, got %i dimensions" %(path, occupancy.ndim))
+    chunks = [zeros((0, 3), dtype= int32)]
+    for start in range(0, len(occupancy), chunk_size):
+        cells = argwhere(occupancy[start: start + chunk_size]).astype(int32)
+        cells[:, 0] += start
+        if occupancy.ndim == 2:
+            cells = concatenate((cells, zeros((len(cells), 1), dtype= int32)), axis= 1)
+        chunks.append(cells)
+    return concatenate(chunks)
+
+pattern_readers = {
+    '.rle' : read_rle,
+    '.cells' : read_plaintext,
+    '.npy' : read_occupancy
+}
+
+def read_pattern(path: str) -> ndarray:
+    """alive cells of a RLE, .cells, .npy or text seed file as (n, 3) int32 locations"""
+    reader = pattern_readers.get(os.path.splitext(path)[1].lower(), None)
+    if reader is None:
+        return array(read_seed(path), dtype= int32).reshape(-1, 3)
+    return reader(path)
+
+def save_generations(path: str, generations: List[ndarray], **settings) -> None:
+    """saves all generations as one packed int32 array with the number of cells per generation"""
+    counts = array([len(locations) for locations in generations], dtype= int64)
+    cells = concatenate([array(locations, dtype= int32).reshape(-1, 3) for locations in generations]) if generations else zeros((0, 3), dtype= int32)
+    with open(path, 'wb') as file:
+        savez_compressed(file, cells= cells, counts= counts, settings= array(json.dumps(settings)))
+
+def load_generations(path: str) -> Tuple[List[ndarray], dict]:
+    with load(path) as data:
+        cells = data['cells']
+        counts = data['counts']
+        settings = json.loads(str(data['settings']))
+    return split(cells, cumsum(counts)[:-1]), settings
+
+def main(argv: List[str] = None) -> None:
+    from argparse import ArgumentParser
+    parser = ArgumentParser(description= "Simulate the Game of Life without Blender, the saved generations can be loaded with 'Load Bake' in the add-on")
+    parser.add_argument('seed', help= "Golly RLE (.rle), plaintext (.cells) or occupancy array (.npy) pattern, otherwise a text file with one 'x y' or 'x y z' location of an alive cell per line")
+    parser.add_argument('output', help= "file the generations are saved to, a frame store streamed to disk if it ends with .frames, otherwise .npz")
+    parser.add_argument('-n', '--generations', type= int, default= 249, help= "number of generations after the seed")
+    parser.add_argument('--low', type= int, default= 2, dest= 'value_low')
+    parser.add_argument('--high', type= int, default= 3, dest= 'value_high')
+    parser.add_argument('--3d', action= 'store_true', dest= 'use_3d')
+    parser.add_argument('--diagonal', action= 'store_true', dest= 'use_diagonal')
+    parser.add_argument('--combine-planes', action= 'store_true', dest= 'combine_planes')
+    parser.add_argument('--engine', choices= list(engines), default= 'DENSE')
+    parser.add_argument('--hashlife-cache', type= int, default= HashlifeWorld.cache_limit, dest= 'hashlife_cache_limit')
+    args = parser.parse_args(argv)
+
+    seed = read_pattern(args.seed)
+    use_frame_store = args.output.endswith('.frames')
+    generations = FrameStore.create(args.output) if use_frame_store else GenerationHistory()
+    generations.append(seed)
+    cycle_start = -1
+    period = 0
+    for message in simulate(seed, args.value_low, args.value_high, args.use_3d, args.use_diagonal, args.combine_planes, args.engine, args.generations, args.hashlife_cache_limit):
+        if message[0] == 'cycle':
+            cycle_start, period = message[1:]
+        else:
+            generations.append(message[1])
+    settings = dict(
+        frames= args.generations + 1, cycle_start= cycle_start, period= period,
+        value_low= args.value_low, value_high= args.value_high, use_3d= args.use_3d, use_diagonal= args.use_diagonal,
+        combine_planes= args.combine_planes, engine= args.engine
+    )
+    if use_frame_store:
+        generations.finish(**settings)
+    else:
+        save_generations(args.output, generations, **settings)
+    print("%i generations saved to %s" %(len(generations), args.output), end= "")
+    print(", repeating with period %i from generation %i" %(period, cycle_start) if period else "")
+
+if __name__ == "__main__":
+    main(sys.argv[1: ])